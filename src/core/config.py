@@ -39,6 +39,8 @@ class AIConfig:
     temperature: float = 0.3
     timeout: int = 30
     bulk_summarize_limit: int = 10  # Number of articles to summarize in bulk operations
+    skip_short_content: bool = True  # Return short content as-is without an API call
+    requests_per_minute: int = 60  # Pacing for bulk API calls (0 = unthrottled)
 
 
 @dataclass
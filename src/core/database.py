@@ -38,9 +38,56 @@ class DatabaseConfig:
             )
         return self._engine
 
+    # Columns added to tables after their initial release; create_all never
+    # ALTERs an existing table, so databases created before these columns
+    # existed get them added here at startup
+    _SCHEMA_ADDITIONS = {
+        "articles": {"feed_id": "INTEGER REFERENCES feeds(id)"},
+        "feeds": {"etag": "VARCHAR", "last_modified": "VARCHAR"},
+    }
+
     def create_tables(self) -> None:
         """Create all tables defined in SQLModel models"""
         SQLModel.metadata.create_all(self.engine)
+        self._add_missing_columns()
+        self._backfill_article_feed_ids()
+
+    def _add_missing_columns(self) -> None:
+        """Add columns that postdate an existing database's schema"""
+        if not self.database_url.startswith("sqlite"):
+            return
+        with self.engine.begin() as connection:
+            for table, columns in self._SCHEMA_ADDITIONS.items():
+                existing = {
+                    row[1]
+                    for row in connection.exec_driver_sql(
+                        f"PRAGMA table_info({table})"
+                    )
+                }
+                for name, ddl_type in columns.items():
+                    if name not in existing:
+                        connection.exec_driver_sql(
+                            f"ALTER TABLE {table} ADD COLUMN {name} {ddl_type}"
+                        )
+            connection.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS ix_articles_feed_id "
+                "ON articles (feed_id)"
+            )
+            # Covers the per-feed statistics aggregate and latest-article
+            # lookup; create_all only builds it for brand-new tables
+            connection.exec_driver_sql(
+                "CREATE INDEX IF NOT EXISTS idx_articles_feed_url_created_at "
+                "ON articles (feed_url, created_at)"
+            )
+
+    def _backfill_article_feed_ids(self) -> None:
+        """Populate articles.feed_id from feed_url for rows predating the FK"""
+        with self.engine.begin() as connection:
+            connection.exec_driver_sql(
+                "UPDATE articles "
+                "SET feed_id = (SELECT id FROM feeds WHERE url = articles.feed_url) "
+                "WHERE feed_id IS NULL"
+            )
 
     def get_session(self) -> Session:
         """Get a new database session"""
@@ -8,7 +8,7 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 from enum import Enum
 from sqlmodel import SQLModel, Field, Column, String, DateTime, JSON
-from sqlalchemy import func
+from sqlalchemy import func, Index
 
 
 class ArticleStatus(str, Enum):
@@ -33,7 +33,11 @@ class Article(SQLModel, table=True):
     """Represents a news article"""
 
     __tablename__ = "articles"
-    __table_args__ = {"extend_existing": True}
+    __table_args__ = (
+        # Covers the per-feed statistics aggregate and latest-article lookup
+        Index("idx_articles_feed_url_created_at", "feed_url", "created_at"),
+        {"extend_existing": True},
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     title: str = Field(index=True)
@@ -41,6 +45,9 @@ class Article(SQLModel, table=True):
     description: Optional[str] = None
     published: Optional[str] = None
     feed_url: str = Field(index=True)
+    # Integer FK alongside the denormalized feed_url string; integer
+    # comparisons and joins are cheaper than VARCHAR ones
+    feed_id: Optional[int] = Field(default=None, foreign_key="feeds.id", index=True)
     content: Optional[str] = None
     summary: Optional[str] = None
     status: ArticleStatus = Field(
@@ -84,6 +91,8 @@ class Feed(SQLModel, table=True):
     last_updated: Optional[datetime] = None
     last_fetch_error: Optional[str] = None
     fetch_interval: int = Field(default=3600)  # seconds
+    etag: Optional[str] = None  # HTTP ETag from the last successful fetch
+    last_modified: Optional[str] = None  # HTTP Last-Modified from the last fetch
     created_at: datetime = Field(
         default_factory=datetime.now,
         sa_column=Column(DateTime(timezone=True), server_default=func.now()),
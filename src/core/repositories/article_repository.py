@@ -3,7 +3,7 @@ Repository for article-related database operations.
 """
 
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from sqlmodel import select, func
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import or_, text
@@ -36,6 +36,45 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error saving article: {e}")
             raise DatabaseError(f"Failed to save article: {e}")
 
+    def save_bulk(self, articles: List[Article]) -> int:
+        """
+        Save new articles in a single transaction, skipping duplicates
+
+        Articles whose link already exists in the database (or appears
+        earlier in the batch) are ignored, so callers can pass every entry
+        from a feed without checking first.
+
+        Args:
+            articles: Articles to insert
+
+        Returns:
+            int: Number of articles actually inserted
+        """
+        if not articles:
+            return 0
+        try:
+            with self.get_session() as session:
+                links = [article.link for article in articles]
+                existing = set(
+                    session.exec(
+                        select(Article.link).where(Article.link.in_(links))
+                    ).all()
+                )
+
+                inserted = 0
+                for article in articles:
+                    if article.link in existing:
+                        continue
+                    existing.add(article.link)
+                    session.add(article)
+                    inserted += 1
+
+                session.commit()
+                return inserted
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk saving articles: {e}")
+            raise DatabaseError(f"Failed to bulk save articles: {e}")
+
     def get_by_id(self, article_id: int) -> Optional[Article]:
         """Get article by ID"""
         try:
@@ -55,6 +94,30 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error getting article by link {link}: {e}")
             raise DatabaseError(f"Failed to get article: {e}")
 
+    def get_by_ids(self, article_ids: List[int]) -> List[Article]:
+        """Get articles for multiple IDs in one query"""
+        if not article_ids:
+            return []
+        try:
+            with self.get_session() as session:
+                statement = select(Article).where(Article.id.in_(article_ids))
+                return list(session.exec(statement))
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting articles by IDs: {e}")
+            raise DatabaseError(f"Failed to get articles: {e}")
+
+    def get_by_links(self, links: List[str]) -> Dict[str, Article]:
+        """Get articles for multiple links in one query, keyed by link"""
+        if not links:
+            return {}
+        try:
+            with self.get_session() as session:
+                statement = select(Article).where(Article.link.in_(links))
+                return {article.link: article for article in session.exec(statement)}
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting articles by links: {e}")
+            raise DatabaseError(f"Failed to get articles: {e}")
+
     def get_all(self, limit: Optional[int] = None, offset: int = 0) -> List[Article]:
         """Get all articles with optional pagination"""
         try:
@@ -69,6 +132,86 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error getting all articles: {e}")
             raise DatabaseError(f"Failed to get articles: {e}")
 
+    def get_previews(
+        self,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        preview_length: int = 500,
+    ) -> List[Article]:
+        """
+        Get articles with content truncated to a preview on the SQL side
+
+        Article content can be very large; truncating with substr() in the
+        query keeps the full text from crossing the database boundary when
+        only a preview is rendered. Use get_content to lazily load the full
+        text for a single article.
+
+        Args:
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+            preview_length: Number of content characters to keep
+
+        Returns:
+            List[Article]: Articles whose content holds at most the preview
+        """
+        try:
+            with self.get_session() as session:
+                statement = (
+                    select(
+                        Article.id,
+                        Article.title,
+                        Article.link,
+                        Article.description,
+                        Article.published,
+                        Article.feed_url,
+                        func.substr(Article.content, 1, preview_length),
+                        Article.summary,
+                        Article.status,
+                        Article.created_at,
+                    )
+                    .order_by(text("created_at DESC"))
+                    .offset(offset)
+                )
+                if limit:
+                    statement = statement.limit(limit)
+
+                return [
+                    Article(
+                        id=row[0],
+                        title=row[1],
+                        link=row[2],
+                        description=row[3],
+                        published=row[4],
+                        feed_url=row[5],
+                        content=row[6],
+                        summary=row[7],
+                        status=row[8],
+                        created_at=row[9],
+                    )
+                    for row in session.exec(statement)
+                ]
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting article previews: {e}")
+            raise DatabaseError(f"Failed to get article previews: {e}")
+
+    def get_content(self, article_id: int) -> Optional[str]:
+        """
+        Get the full content of a single article
+
+        Args:
+            article_id: Article ID
+
+        Returns:
+            Optional[str]: Full content, or None if missing
+        """
+        try:
+            with self.get_session() as session:
+                statement = select(Article.content).where(Article.id == article_id)
+                return session.exec(statement).first()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting content for article {article_id}: {e}")
+            raise DatabaseError(f"Failed to get article content: {e}")
+
     def get_by_feed_url(
         self, feed_url: str, limit: Optional[int] = None
     ) -> List[Article]:
@@ -174,6 +317,46 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error updating article summary for ID {article_id}: {e}")
             raise DatabaseError(f"Failed to update article summary: {e}")
 
+    def update_content_bulk(self, updates: List[Tuple[int, str]]) -> int:
+        """Update content for multiple articles in a single transaction"""
+        if not updates:
+            return 0
+        try:
+            with self.get_session() as session:
+                updated = 0
+                for article_id, content in updates:
+                    article = session.get(Article, article_id)
+                    if article:
+                        article.content = content
+                        article.status = ArticleStatus.SCRAPED
+                        session.add(article)
+                        updated += 1
+                session.commit()
+                return updated
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk updating article content: {e}")
+            raise DatabaseError(f"Failed to bulk update article content: {e}")
+
+    def update_summary_bulk(self, updates: List[Tuple[int, str]]) -> int:
+        """Update summaries for multiple articles in a single transaction"""
+        if not updates:
+            return 0
+        try:
+            with self.get_session() as session:
+                updated = 0
+                for article_id, summary in updates:
+                    article = session.get(Article, article_id)
+                    if article:
+                        article.summary = summary
+                        article.status = ArticleStatus.SUMMARIZED
+                        session.add(article)
+                        updated += 1
+                session.commit()
+                return updated
+        except SQLAlchemyError as e:
+            logger.error(f"Error bulk updating article summaries: {e}")
+            raise DatabaseError(f"Failed to bulk update article summaries: {e}")
+
     def delete(self, article_id: int) -> bool:
         """Delete an article"""
         try:
@@ -203,6 +386,15 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error deleting articles by feed URL {feed_url}: {e}")
             raise DatabaseError(f"Failed to delete articles: {e}")
 
+    def get_max_id(self) -> Optional[int]:
+        """Get the highest article ID, a cheap version token for caches"""
+        try:
+            with self.get_session() as session:
+                return session.exec(select(func.max(Article.id))).one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting max article ID: {e}")
+            raise DatabaseError(f"Failed to get max article ID: {e}")
+
     def get_count(self) -> int:
         """Get total article count"""
         try:
@@ -213,6 +405,21 @@ class ArticleRepository(BaseRepository):
             logger.error(f"Error getting article count: {e}")
             raise DatabaseError(f"Failed to get article count: {e}")
 
+    def get_count_from_active_feeds(self) -> int:
+        """Get total count of articles belonging to active feeds"""
+        try:
+            with self.get_session() as session:
+                statement = (
+                    select(func.count())
+                    .select_from(Article)
+                    .join(Feed, Article.feed_url == Feed.url)
+                    .where(Feed.status == FeedStatus.ACTIVE)
+                )
+                return session.exec(statement).one()
+        except SQLAlchemyError as e:
+            logger.error(f"Error counting articles from active feeds: {e}")
+            raise DatabaseError(f"Failed to count articles: {e}")
+
     def get_count_by_feed_url(self, feed_url: str) -> int:
         """Get article count by feed URL"""
         try:
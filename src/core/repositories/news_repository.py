@@ -77,6 +77,12 @@ class NewsRepository:
         except Exception:
             return None
 
+    def get_articles_preview(
+        self, limit: Optional[int] = None, offset: int = 0
+    ) -> List[Article]:
+        """Get articles with content truncated to a preview in SQL"""
+        return self.articles.get_previews(limit=limit, offset=offset)
+
     def get_articles_since(self, cutoff_time: datetime) -> List[Article]:
         """Get articles created since a specific datetime"""
         return self.articles.get_articles_since(cutoff_time)
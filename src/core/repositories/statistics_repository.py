@@ -6,10 +6,9 @@ import logging
 from typing import Optional, Dict, Any
 from sqlmodel import select, func
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import text
+from sqlalchemy import case
 
 from ..models import Article, Feed, FeedStatistics, FeedStatus
-from ..database import get_session
 from .base import BaseRepository
 from .exceptions import DatabaseError
 
@@ -27,48 +26,38 @@ class StatisticsRepository(BaseRepository):
                 if not feed:
                     return None
 
-                # Get article counts
-                total_articles = session.exec(
-                    select(func.count())
-                    .select_from(Article)
-                    .where(Article.feed_url == feed.url)
-                ).one()
-
-                articles_with_content = session.exec(
-                    select(func.count())
-                    .select_from(Article)
-                    .where(
-                        (Article.feed_url == feed.url)
-                        & (Article.content is not None)
-                        & (Article.content != "")
-                    )
-                ).one()
-
-                articles_with_summary = session.exec(
-                    select(func.count())
-                    .select_from(Article)
-                    .where(
-                        (Article.feed_url == feed.url)
-                        & (Article.summary is not None)
-                        & (Article.summary != "")
-                    )
+                # All counts and the latest article date in one aggregate
+                # instead of four separate scans
+                has_content = case(
+                    (
+                        (Article.content.is_not(None)) & (Article.content != ""),
+                        1,
+                    ),
+                    else_=0,
+                )
+                has_summary = case(
+                    (
+                        (Article.summary.is_not(None)) & (Article.summary != ""),
+                        1,
+                    ),
+                    else_=0,
+                )
+                row = session.exec(
+                    select(
+                        func.count(Article.id),
+                        func.sum(has_content),
+                        func.sum(has_summary),
+                        func.max(Article.created_at),
+                    ).where(Article.feed_url == feed.url)
                 ).one()
 
-                # Get latest article date
-                latest_article = session.exec(
-                    select(Article.created_at)
-                    .where(Article.feed_url == feed.url)
-                    .order_by(text("created_at DESC"))
-                    .limit(1)
-                ).first()
-
                 return FeedStatistics(
                     feed_id=feed.id,
                     feed_title=feed.display_name,
-                    total_articles=total_articles,
-                    articles_with_content=articles_with_content,
-                    articles_with_summary=articles_with_summary,
-                    latest_article_date=latest_article,
+                    total_articles=row[0],
+                    articles_with_content=row[1] or 0,
+                    articles_with_summary=row[2] or 0,
+                    latest_article_date=row[3],
                     last_updated=feed.last_updated,
                     error_count=1 if feed.status == FeedStatus.ERROR else 0,
                 )
@@ -76,10 +65,65 @@ class StatisticsRepository(BaseRepository):
             logger.error(f"Error getting feed statistics for ID {feed_id}: {e}")
             raise DatabaseError(f"Failed to get feed statistics: {e}")
 
+    def get_all_feed_statistics(self) -> Dict[int, FeedStatistics]:
+        """Get statistics for every feed from a single grouped query"""
+        try:
+            with self.get_session() as session:
+                feeds = list(session.exec(select(Feed)))
+                if not feeds:
+                    return {}
+
+                # One aggregate over the articles table instead of several
+                # queries per feed
+                has_content = case(
+                    (
+                        (Article.content.is_not(None)) & (Article.content != ""),
+                        1,
+                    ),
+                    else_=0,
+                )
+                has_summary = case(
+                    (
+                        (Article.summary.is_not(None)) & (Article.summary != ""),
+                        1,
+                    ),
+                    else_=0,
+                )
+                rows = session.exec(
+                    select(
+                        Article.feed_url,
+                        func.count(Article.id),
+                        func.sum(has_content),
+                        func.sum(has_summary),
+                        func.max(Article.created_at),
+                    ).group_by(Article.feed_url)
+                ).all()
+                counts_by_url = {row[0]: row for row in rows}
+
+                statistics = {}
+                for feed in feeds:
+                    if feed.id is None:
+                        continue
+                    row = counts_by_url.get(feed.url)
+                    statistics[feed.id] = FeedStatistics(
+                        feed_id=feed.id,
+                        feed_title=feed.display_name,
+                        total_articles=row[1] if row else 0,
+                        articles_with_content=(row[2] or 0) if row else 0,
+                        articles_with_summary=(row[3] or 0) if row else 0,
+                        latest_article_date=row[4] if row else None,
+                        last_updated=feed.last_updated,
+                        error_count=1 if feed.status == FeedStatus.ERROR else 0,
+                    )
+                return statistics
+        except SQLAlchemyError as e:
+            logger.error(f"Error getting statistics for all feeds: {e}")
+            raise DatabaseError(f"Failed to get statistics for all feeds: {e}")
+
     def get_global_statistics(self) -> Dict[str, Any]:
         """Get global statistics"""
         try:
-            with get_session() as session:
+            with self.get_session() as session:
                 # Total counts
                 total_articles = session.exec(
                     select(func.count()).select_from(Article)
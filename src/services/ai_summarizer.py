@@ -4,9 +4,13 @@ AI summarization service for the News Aggregator application.
 This module handles AI-powered summarization of article content using OpenAI's API.
 """
 
+import httpx
 import openai
 import logging
-from typing import Optional, List
+import random
+import threading
+import time
+from typing import Any, Iterator, Optional, List
 
 from ..core.models import AIModelInfo
 from ..core.repository import NewsRepository
@@ -14,6 +18,23 @@ from ..core.config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# One tuned connection pool shared by every OpenAI client this module builds.
+# The default httpx pool is small enough to hit PoolTimeout under concurrent
+# bulk operations, and building a pool per AISummarizer instance wastes the
+# keep-alive connections the previous instance already opened.
+_shared_http_client: Optional[httpx.Client] = None
+
+
+def _get_http_client() -> httpx.Client:
+    """Get (lazily creating) the shared httpx client for OpenAI requests"""
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=64),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+    return _shared_http_client
+
 
 class AISummarizer:
     """
@@ -33,6 +54,7 @@ class AISummarizer:
         self.logger = logger
         self.client: Optional[openai.OpenAI] = None
         self._available_models_cache: Optional[List[AIModelInfo]] = None
+        self._last_request_time = 0.0
         self._initialize_client()
 
     def _initialize_client(self) -> None:
@@ -44,7 +66,31 @@ class AISummarizer:
             )
             self.client = None
         else:
-            self.client = openai.OpenAI(api_key=api_key)
+            self.client = openai.OpenAI(
+                api_key=api_key, http_client=_get_http_client()
+            )
+            self._prewarm_connection()
+
+    def _prewarm_connection(self) -> None:
+        """Warm up the HTTPS connection pool in the background.
+
+        The first completion request otherwise pays DNS + TCP + TLS handshake
+        latency; a cheap models.list() from a daemon thread moves that cost
+        off the critical path.
+        """
+        client = self.client
+        if client is None:
+            return
+
+        def _warm() -> None:
+            try:
+                client.models.list()
+            except Exception:
+                # Best effort only - a failed pre-warm just means the first
+                # real request pays the handshake cost as before
+                pass
+
+        threading.Thread(target=_warm, daemon=True).start()
 
     def update_api_key(self, api_key: str) -> bool:
         """
@@ -173,6 +219,50 @@ class AISummarizer:
         """
         return self.client is not None
 
+    def _pace_request(self) -> None:
+        """Sleep as needed to keep completion calls under the configured
+        requests-per-minute budget (0 disables pacing)"""
+        rpm = self.config.ai_config.requests_per_minute
+        if not rpm or rpm <= 0:
+            return
+
+        interval = 60.0 / rpm
+        wait = interval - (time.monotonic() - self._last_request_time)
+        if wait > 0:
+            time.sleep(wait)
+        self._last_request_time = time.monotonic()
+
+    def _create_completion(self, max_attempts: int = 5, **kwargs: Any) -> Any:
+        """
+        Create a chat completion with RPM pacing and rate-limit retries
+
+        Args:
+            max_attempts: Maximum number of attempts before giving up
+            **kwargs: Arguments forwarded to chat.completions.create
+
+        Returns:
+            The completion response
+        """
+        if self.client is None:
+            raise RuntimeError("OpenAI client not initialized")
+
+        for attempt in range(1, max_attempts + 1):
+            self._pace_request()
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except (openai.RateLimitError, openai.APIConnectionError) as e:
+                if attempt == max_attempts:
+                    raise
+                # Exponential backoff with jitter so concurrent callers
+                # don't retry in lockstep
+                backoff = min(2**attempt, 30) * (1 + random.random() * 0.25)
+                self.logger.warning(
+                    f"OpenAI request throttled ({e.__class__.__name__}), "
+                    f"retrying in {backoff:.1f}s "
+                    f"(attempt {attempt}/{max_attempts})"
+                )
+                time.sleep(backoff)
+
     def generate_summary(self, content: str, title: str = "") -> Optional[str]:
         """
         Generate AI summary of article content
@@ -187,6 +277,15 @@ class AISummarizer:
         if not self.client:
             return "AI summarization unavailable - API key not configured"
 
+        # Content already shorter than the target summary length gains nothing
+        # from an API round trip - return it as-is unless the user disabled this
+        if (
+            self.config.ai_config.skip_short_content
+            and len(content) <= self.config.ai_config.max_summary_length
+        ):
+            summary = content.strip()
+            return summary if summary else None
+
         try:
             current_model = self.get_current_model()
 
@@ -205,21 +304,18 @@ class AISummarizer:
                 )
                 current_model = new_model.model_id
 
-            # Prepare the prompt
+            # Prepare a compact prompt - triple-quoted indentation (and any
+            # inline comment) would be sent to the model as paid input tokens
             max_summary_length = self.config.ai_config.max_summary_length
-            prompt = f"""
-            Please summarize the following news article in {max_summary_length // 4} words or less.
-            Focus on the key facts, main points, and important details.
-
-            Title: {title}
-
-            Article Content:
-            {content[:3000]}  # Limit content to avoid token limits
-
-            Summary:
-            """
+            snippet = content[:3000] if len(content) > 3000 else content
+            prompt = (
+                f"Summarize the following news article in "
+                f"{max_summary_length // 4} words or less. Focus on the key "
+                f"facts, main points, and important details.\n\n"
+                f"Title: {title}\n\n{snippet}"
+            )
 
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=current_model,
                 messages=[
                     {
@@ -299,10 +395,29 @@ class AISummarizer:
             articles = self.repository.articles.get_without_summary(limit)
             summarized_count = 0
 
+            # Accumulate generated summaries and flush in batches so the
+            # database sees a few transactions instead of one per article
+            pending: List[tuple] = []
+            batch_size = 100
+
             for article in articles:
                 if (article.content or article.description) and article.id is not None:
-                    if self.summarize_article(article.id):
-                        summarized_count += 1
+                    summary = self.generate_summary(
+                        article.content or article.description, article.title
+                    )
+                    if summary:
+                        pending.append((article.id, summary))
+
+                if len(pending) >= batch_size:
+                    summarized_count += self.repository.articles.update_summary_bulk(
+                        pending
+                    )
+                    pending = []
+
+            if pending:
+                summarized_count += self.repository.articles.update_summary_bulk(
+                    pending
+                )
 
             return summarized_count
 
@@ -341,7 +456,7 @@ class AISummarizer:
                 )
                 current_model = new_model.model_id
 
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=current_model,
                 messages=[
                     {
@@ -365,6 +480,47 @@ class AISummarizer:
             self.logger.error(f"Error generating daily summary: {e}")
             return f"Error generating daily summary: {str(e)}"
 
+    def generate_daily_summary_stream(self, content: str) -> Iterator[str]:
+        """
+        Stream a daily news summary as it is generated
+
+        Yields text deltas so the UI can display the summary from the first
+        token instead of blocking for the full response. Callers should fall
+        back to generate_daily_summary if this raises.
+
+        Args:
+            content: Combined content from multiple articles to summarize
+
+        Yields:
+            str: Incremental pieces of the generated summary
+
+        Raises:
+            RuntimeError: If no OpenAI client is configured
+        """
+        if not self.client:
+            raise RuntimeError("AI summarization unavailable - API key not configured")
+
+        stream = self._create_completion(
+            model=self.get_current_model(),
+            messages=[
+                {
+                    "role": "system",
+                    "content": """You are a professional news editor creating daily news digests. Your task is to synthesize multiple news articles into a single, flowing narrative that reads like a comprehensive news briefing. Write in a clear, engaging style that connects related stories and provides context.""",
+                },
+                {"role": "user", "content": content},
+            ],
+            max_tokens=800,
+            temperature=0.3,
+            timeout=self.config.ai_config.timeout,
+            stream=True,
+        )
+
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
     def generate_summary_from_text(self, text: str) -> str:
         """
         Generate AI summary from arbitrary text (for daily summaries)
@@ -393,7 +549,7 @@ class AISummarizer:
                 self.config.ai_config.selected_model = new_model.model_id
                 current_model = new_model.model_id
 
-            response = self.client.chat.completions.create(
+            response = self._create_completion(
                 model=current_model,
                 messages=[
                     {
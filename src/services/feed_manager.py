@@ -7,7 +7,11 @@ feed validation, and bulk operations.
 
 import feedparser  # type: ignore
 import logging
-from typing import List, Dict, Any, Optional
+import requests
+import time
+from requests.adapters import HTTPAdapter, Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Iterator, List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 
 from ..core.models import Article, Feed, FeedStatus
@@ -16,6 +20,15 @@ from ..core.config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Validation results are cached briefly so the validate-then-add flow only
+# fetches and parses the feed once
+VALIDATION_CACHE_TTL = 60.0
+MAX_CACHED_VALIDATIONS = 128
+
+# Parsed feed objects are large, so keep only a handful around for the
+# validate -> add -> first-fetch flow
+MAX_CACHED_PARSES = 8
+
 
 class FeedManager:
     """Service class for managing RSS feeds"""
@@ -31,6 +44,23 @@ class FeedManager:
         self.config = config
         self.repository = repository
         self.logger = logger
+        self._validation_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._parsed_feeds: Dict[str, Any] = {}
+
+        # Feed rows with updated conditional headers, staged by fetches on
+        # worker threads and persisted from the result-consuming thread
+        self._pending_headers: Dict[str, Feed] = {}
+
+        # Shared pooled session so fetches reuse TCP/TLS connections across
+        # feeds instead of handshaking per call
+        self._http = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(total=2, backoff_factor=0.5),
+        )
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
 
     def add_feed(self, url: str, title: str = "", description: str = "") -> bool:
         """
@@ -66,38 +96,86 @@ class FeedManager:
 
             # Add to repository
             feed_id = self.repository.create_feed(feed)
-            return feed_id is not None
+            if feed_id is None:
+                return False
+
+            # Seed the new feed's articles off the parse cached during
+            # validation, so onboarding costs a single fetch
+            if url in self._parsed_feeds:
+                try:
+                    self.repository.articles.save_bulk(self.fetch_feed_articles(url))
+                    self._flush_conditional_headers(url)
+                except Exception as e:
+                    self.logger.warning(f"Could not seed articles for {url}: {e}")
+
+            return True
 
         except Exception as e:
             self.logger.error(f"Error adding feed {url}: {e}")
             return False
 
-    def fetch_feed_articles(self, feed_url: str) -> List[Article]:
+    def fetch_feed_articles(
+        self, feed_url: str, limit: Optional[int] = None
+    ) -> List[Article]:
         """
         Fetch articles from a single RSS feed
 
         Args:
             feed_url: RSS feed URL
+            limit: Optional maximum number of articles to build
 
         Returns:
             List[Article]: List of article objects
         """
         articles = []
         try:
-            feed = feedparser.parse(feed_url)
+            stored_feed = self.repository.feeds.get_by_url(feed_url)
+
+            # Reuse the parse from a recent validate_feed_url call if there
+            # is one, so validate -> add -> first fetch parses only once
+            feed = self._parsed_feeds.pop(feed_url, None)
+            if feed is None:
+                # Send the conditional headers from the last successful fetch
+                # so unchanged feeds answer 304 without a body to parse
+                headers = {}
+                if stored_feed and stored_feed.etag:
+                    headers["If-None-Match"] = stored_feed.etag
+                if stored_feed and stored_feed.last_modified:
+                    headers["If-Modified-Since"] = stored_feed.last_modified
+
+                response = self._http.get(feed_url, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    self.logger.debug(
+                        f"Feed not modified since last fetch: {feed_url}"
+                    )
+                    return articles
+                response.raise_for_status()
+
+                # Skip feedparser's HTML sanitization and relative-URI
+                # resolution passes; we only read plain fields and they
+                # dominate parse time on large feeds
+                feed = feedparser.parse(
+                    response.content,
+                    resolve_relative_uris=False,
+                    sanitize_html=False,
+                )
+
+                self._store_conditional_headers(stored_feed, response)
 
             for entry in feed.entries:
+                # Stop before building Article objects past the limit; the
+                # entries iterable is never materialized beyond this point
+                if limit is not None and len(articles) >= limit:
+                    break
+
                 # Extract article data
                 title = entry.get("title", "No Title")
                 link = entry.get("link", "")
                 description = entry.get("description", entry.get("summary", ""))
 
-                # Handle published date
-                published = ""
-                if hasattr(entry, "published"):
-                    published = entry.published
-                elif hasattr(entry, "updated"):
-                    published = entry.updated
+                # Handle published date (mapping access avoids hasattr's
+                # exception probing on FeedParserDict)
+                published = entry.get("published") or entry.get("updated", "")
 
                 article = Article(
                     title=title,
@@ -105,6 +183,7 @@ class FeedManager:
                     description=description,
                     published=published,
                     feed_url=feed_url,
+                    feed_id=stored_feed.id if stored_feed else None,
                 )
                 articles.append(article)
 
@@ -113,6 +192,45 @@ class FeedManager:
 
         return articles
 
+    def _store_conditional_headers(
+        self, stored_feed: Optional[Feed], response: requests.Response
+    ) -> None:
+        """
+        Stage the ETag/Last-Modified headers from a feed response
+
+        Runs on fetch worker threads, so nothing is written to the database
+        here; _flush_conditional_headers persists the staged row from the
+        thread that consumes the fetch results.
+
+        Args:
+            stored_feed: Feed row to update, if the feed is in the database
+            response: HTTP response from fetching the feed
+        """
+        if stored_feed is None:
+            return
+
+        etag = response.headers.get("ETag")
+        modified = response.headers.get("Last-Modified")
+        if etag == stored_feed.etag and modified == stored_feed.last_modified:
+            return
+
+        stored_feed.etag = etag
+        stored_feed.last_modified = modified
+        self._pending_headers[stored_feed.url] = stored_feed
+
+    def _flush_conditional_headers(self, feed_url: str) -> None:
+        """Persist conditional headers staged by a fetch of the feed"""
+        feed = self._pending_headers.pop(feed_url, None)
+        if feed is None:
+            return
+
+        try:
+            self.repository.feeds.save(feed)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not store conditional headers for {feed_url}: {e}"
+            )
+
     def update_all_feeds(self) -> Dict[str, int]:
         """
         Update all active feeds and return summary
@@ -123,35 +241,51 @@ class FeedManager:
         feeds = self.repository.get_all_feeds(include_inactive=False)
         results = {"total_feeds": len(feeds), "new_articles": 0, "errors": 0}
 
-        for feed in feeds:
-            try:
-                articles = self.fetch_feed_articles(feed.url)
+        if not feeds:
+            return results
 
-                for article in articles:
-                    article_id = self.repository.create_article(article)
-                    if article_id:
-                        results["new_articles"] += 1
+        # Feed fetching is network-bound, so fetch all feeds concurrently and
+        # keep the database writes on this thread as results come in
+        max_workers = min(len(feeds), self.config.feeds.concurrent_fetches)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_feed = {
+                executor.submit(self.fetch_feed_articles, feed.url): feed
+                for feed in feeds
+            }
 
-                # Update feed's last updated timestamp
-                if feed.id is not None:
-                    self.repository.update_feed_last_updated(feed.id)
+            for future in as_completed(future_to_feed):
+                feed = future_to_feed[future]
+                try:
+                    articles = future.result()
+                    self._flush_conditional_headers(feed.url)
 
-            except Exception as e:
-                self.logger.error(f"Error updating feed {feed.url}: {e}")
-                results["errors"] += 1
+                    # One transaction per feed instead of one per article
+                    results["new_articles"] += self.repository.articles.save_bulk(
+                        articles
+                    )
+
+                    # Update feed's last updated timestamp
+                    if feed.id is not None:
+                        self.repository.update_feed_last_updated(feed.id)
+
+                except Exception as e:
+                    self.logger.error(f"Error updating feed {feed.url}: {e}")
+                    results["errors"] += 1
 
         return results
 
-    def get_feed_list(self) -> List[Dict[str, Any]]:
+    def get_feed_list(self) -> Iterator[Dict[str, Any]]:
         """
-        Get list of all feeds (legacy compatibility method)
+        Get all feeds as dictionaries (legacy compatibility method)
+
+        Yields lazily so callers that only iterate never hold the feed
+        objects and their dictionaries in memory at once.
 
         Returns:
-            List[Dict[str, Any]]: List of feed dictionaries
+            Iterator[Dict[str, Any]]: Feed dictionaries
         """
-        feeds = self.repository.get_all_feeds()
-        return [
-            {
+        for feed in self.repository.get_all_feeds():
+            yield {
                 "id": feed.id,
                 "url": feed.url,
                 "title": feed.title,
@@ -160,8 +294,6 @@ class FeedManager:
                 "active": feed.status == FeedStatus.ACTIVE,
                 "created_at": feed.created_at,
             }
-            for feed in feeds
-        ]
 
     # CRUD Operations for Feeds
 
@@ -280,25 +412,61 @@ class FeedManager:
         try:
             stats = self.repository.get_feed_statistics(feed_id)
             if stats:
-                return {
-                    "feed_id": stats.feed_id,
-                    "feed_title": stats.feed_title,
-                    "total_articles": stats.total_articles,
-                    "articles_with_content": stats.articles_with_content,
-                    "articles_with_summary": stats.articles_with_summary,
-                    "latest_article_date": stats.latest_article_date.isoformat()
-                    if stats.latest_article_date
-                    else None,
-                    "last_updated": stats.last_updated.isoformat()
-                    if stats.last_updated
-                    else None,
-                    "error_count": stats.error_count,
-                }
+                return self._statistics_to_dict(stats)
             return {}
         except Exception as e:
             self.logger.error(f"Error getting feed statistics for {feed_id}: {e}")
             return {}
 
+    def get_all_feed_statistics(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Get statistics for all feeds with a single grouped query, avoiding
+        one repository round-trip per feed
+
+        Returns:
+            Dict[int, Dict[str, Any]]: Statistics dictionaries keyed by feed ID
+        """
+        try:
+            all_stats = self.repository.statistics.get_all_feed_statistics()
+            return {
+                feed_id: self._statistics_to_dict(stats)
+                for feed_id, stats in all_stats.items()
+            }
+        except Exception as e:
+            self.logger.error(f"Error getting statistics for all feeds: {e}")
+            return {}
+
+    def count_articles_from_active_feeds(self) -> int:
+        """
+        Count articles belonging to active feeds with a single query
+
+        Returns:
+            int: Total number of articles from active feeds
+        """
+        try:
+            return self.repository.articles.get_count_from_active_feeds()
+        except Exception as e:
+            self.logger.error(f"Error counting articles from active feeds: {e}")
+            return 0
+
+    @staticmethod
+    def _statistics_to_dict(stats: Any) -> Dict[str, Any]:
+        """Convert a FeedStatistics object to the legacy dictionary shape"""
+        return {
+            "feed_id": stats.feed_id,
+            "feed_title": stats.feed_title,
+            "total_articles": stats.total_articles,
+            "articles_with_content": stats.articles_with_content,
+            "articles_with_summary": stats.articles_with_summary,
+            "latest_article_date": stats.latest_article_date.isoformat()
+            if stats.latest_article_date
+            else None,
+            "last_updated": stats.last_updated.isoformat()
+            if stats.last_updated
+            else None,
+            "error_count": stats.error_count,
+        }
+
     def validate_feed_url(self, url: str) -> Dict[str, Any]:
         """
         Validate a feed URL and return metadata
@@ -309,26 +477,51 @@ class FeedManager:
         Returns:
             Dict[str, Any]: Validation result with metadata
         """
+        # Validate then add parses the same URL twice back-to-back, so reuse
+        # a recent result instead of re-fetching the feed
+        cached = self._validation_cache.get(url)
+        if cached and time.monotonic() - cached[0] < VALIDATION_CACHE_TTL:
+            return cached[1]
+
         try:
             # Parse feed (feedparser handles timeouts internally)
             feed = feedparser.parse(url)
 
             if not feed.entries:
-                return {"valid": False, "error": "No entries found in feed", "url": url}
-
-            return {
-                "valid": True,
-                "url": url,
-                "title": feed.feed.get("title", "Unknown Feed"),
-                "description": feed.feed.get("description", ""),
-                "entry_count": len(feed.entries),
-                "latest_entry": feed.entries[0].get("title", "No title")
-                if feed.entries
-                else None,
-            }
+                result = {
+                    "valid": False,
+                    "error": "No entries found in feed",
+                    "url": url,
+                }
+            else:
+                # Keep the parsed object so a following add/fetch of the
+                # same URL does not need to re-download and re-parse it
+                if len(self._parsed_feeds) >= MAX_CACHED_PARSES:
+                    self._parsed_feeds.pop(next(iter(self._parsed_feeds)))
+                self._parsed_feeds[url] = feed
+
+                result = {
+                    "valid": True,
+                    "url": url,
+                    "title": feed.feed.get("title", "Unknown Feed"),
+                    "description": feed.feed.get("description", ""),
+                    "entry_count": len(feed.entries),
+                    "latest_entry": feed.entries[0].get("title", "No title")
+                    if feed.entries
+                    else None,
+                }
 
         except Exception as e:
-            return {"valid": False, "error": str(e), "url": url}
+            result = {"valid": False, "error": str(e), "url": url}
+
+        self._cache_validation(url, result)
+        return result
+
+    def _cache_validation(self, url: str, result: Dict[str, Any]) -> None:
+        """Cache a validation result, evicting the oldest entry when full"""
+        if len(self._validation_cache) >= MAX_CACHED_VALIDATIONS:
+            self._validation_cache.pop(next(iter(self._validation_cache)))
+        self._validation_cache[url] = (time.monotonic(), result)
 
     def bulk_update_feeds(self, feed_ids: List[int]) -> Dict[str, int]:
         """
@@ -342,26 +535,48 @@ class FeedManager:
         """
         results = {"updated": 0, "errors": 0, "new_articles": 0}
 
+        # Resolve IDs to active feeds up front
+        feeds = []
         for feed_id in feed_ids:
             try:
                 feed = self.get_feed_by_id(feed_id)
                 if feed and feed.status == FeedStatus.ACTIVE:
-                    articles = self.fetch_feed_articles(feed.url)
-                    new_count = 0
+                    feeds.append(feed)
+            except Exception as e:
+                self.logger.error(f"Error loading feed {feed_id}: {e}")
+                results["errors"] += 1
+
+        if not feeds:
+            return results
+
+        # Same concurrency pattern as update_all_feeds: fetch in parallel,
+        # write to the database from this thread as results arrive
+        max_workers = min(len(feeds), self.config.feeds.concurrent_fetches)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_feed = {
+                executor.submit(self.fetch_feed_articles, feed.url): feed
+                for feed in feeds
+            }
+
+            for future in as_completed(future_to_feed):
+                feed = future_to_feed[future]
+                try:
+                    articles = future.result()
+                    self._flush_conditional_headers(feed.url)
 
-                    for article in articles:
-                        if self.repository.create_article(article):
-                            new_count += 1
+                    # One transaction per feed instead of one per article
+                    new_count = self.repository.articles.save_bulk(articles)
 
                     # Update last_updated timestamp
-                    self.repository.update_feed_last_updated(feed_id)
+                    if feed.id is not None:
+                        self.repository.update_feed_last_updated(feed.id)
 
                     results["updated"] += 1
                     results["new_articles"] += new_count
 
-            except Exception as e:
-                self.logger.error(f"Error updating feed {feed_id}: {e}")
-                results["errors"] += 1
+                except Exception as e:
+                    self.logger.error(f"Error updating feed {feed.id}: {e}")
+                    results["errors"] += 1
 
         return results
 
@@ -5,18 +5,28 @@ This module provides Streamlit components for displaying and managing articles.
 """
 
 import streamlit as st
-from typing import List, TYPE_CHECKING
+from typing import List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..core.models import Article
+    from ..core.repository import NewsRepository
 
+# Articles rendered per page; Streamlit rebuilds every widget on each rerun,
+# so rendering the full list makes interactions O(total articles)
+ARTICLES_PER_PAGE = 25
 
-def render_article_display(articles: List["Article"]) -> None:
+
+def render_article_display(
+    articles: List["Article"], repository: Optional["NewsRepository"] = None
+) -> None:
     """
     Render article display interface
 
     Args:
-        articles: List of articles to display
+        articles: List of articles to display; content may be a preview
+            (e.g. from repository.get_articles_preview)
+        repository: Repository used to lazily load full article content.
+            When omitted, only the preview is shown.
     """
 
     if not articles:
@@ -25,7 +35,25 @@ def render_article_display(articles: List["Article"]) -> None:
 
     st.header(f"📰 Latest Articles ({len(articles)})")
 
-    for article in articles:
+    # Render one page of expanders at a time
+    total_pages = (len(articles) + ARTICLES_PER_PAGE - 1) // ARTICLES_PER_PAGE
+    page = min(st.session_state.get("article_page", 0), total_pages - 1)
+    start = page * ARTICLES_PER_PAGE
+
+    if total_pages > 1:
+        col1, col2, col3 = st.columns([1, 2, 1])
+        with col1:
+            if st.button("⬅️ Previous", disabled=page == 0):
+                st.session_state["article_page"] = page - 1
+                st.rerun()
+        with col2:
+            st.caption(f"Page {page + 1} of {total_pages}")
+        with col3:
+            if st.button("Next ➡️", disabled=page >= total_pages - 1):
+                st.session_state["article_page"] = page + 1
+                st.rerun()
+
+    for article in articles[start : start + ARTICLES_PER_PAGE]:
         with st.expander(f"📄 {article.title}", expanded=False):
             if article.link:
                 st.markdown(f"**[Read Full Article]({article.link})**")
@@ -36,11 +64,17 @@ def render_article_display(articles: List["Article"]) -> None:
 
             if article.content:
                 st.write("**Content:**")
-                st.write(
-                    article.content[:500] + "..."
-                    if len(article.content) > 500
-                    else article.content
-                )
+                if st.session_state.get(f"full_content_{article.id}") and repository:
+                    st.write(repository.articles.get_content(article.id))
+                elif len(article.content) >= 500:
+                    st.write(article.content[:500] + "...")
+                    if repository and st.button(
+                        "Load full content", key=f"full_{article.id}"
+                    ):
+                        st.session_state[f"full_content_{article.id}"] = True
+                        st.rerun()
+                else:
+                    st.write(article.content)
 
             if article.summary:
                 st.write("**AI Summary:**")
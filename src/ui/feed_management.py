@@ -14,6 +14,28 @@ if TYPE_CHECKING:
     from ..services.feed_manager import FeedManager
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _load_feeds_and_stats(_feed_manager: "FeedManager", include_inactive: bool):
+    """
+    Load feeds and their statistics, cached across Streamlit reruns
+
+    Streamlit re-runs the whole script on every widget interaction; caching
+    here keeps typing in an edit form from re-querying the database each
+    keystroke. The leading underscore tells st.cache_data not to hash the
+    manager. Call _load_feeds_and_stats.clear() after any feed mutation.
+
+    Args:
+        _feed_manager: FeedManager instance for feed operations
+        include_inactive: Whether to include inactive feeds
+
+    Returns:
+        Tuple of (feeds, stats_map keyed by feed ID)
+    """
+    feeds = _feed_manager.get_all_feeds(include_inactive=include_inactive)
+    stats_map = _feed_manager.get_all_feed_statistics()
+    return feeds, stats_map
+
+
 def render_feed_management_ui(feed_manager: "FeedManager") -> None:
     """
     Render comprehensive feed management interface
@@ -50,7 +72,7 @@ def render_feeds_list(feed_manager: "FeedManager") -> None:
         feed_manager: FeedManager instance for feed operations
     """
 
-    feeds = feed_manager.get_all_feeds(include_inactive=False)
+    feeds, stats_map = _load_feeds_and_stats(feed_manager, include_inactive=False)
 
     if not feeds:
         st.info("No active feeds found. Add some feeds to get started!")
@@ -65,6 +87,7 @@ def render_feeds_list(feed_manager: "FeedManager") -> None:
             feed_ids = [feed.id for feed in feeds if feed.id]
             with st.spinner("Updating all feeds..."):
                 results = feed_manager.bulk_update_feeds(feed_ids)
+                _load_feeds_and_stats.clear()
                 st.success(
                     f"Updated {results['updated']} feeds. Found {results['new_articles']} new articles."
                 )
@@ -92,6 +115,7 @@ def render_feeds_list(feed_manager: "FeedManager") -> None:
                 # Delete button
                 if st.button("🗑️ Delete", key=f"delete_{feed.id}", type="secondary"):
                     if feed.id is not None and feed_manager.delete_feed(feed.id):
+                        _load_feeds_and_stats.clear()
                         st.success("Feed deleted successfully!")
                         st.rerun()
                     else:
@@ -112,6 +136,7 @@ def render_feeds_list(feed_manager: "FeedManager") -> None:
                             if feed.id is not None and feed_manager.update_feed(
                                 feed.id, new_title, new_description
                             ):
+                                _load_feeds_and_stats.clear()
                                 st.success("Feed updated successfully!")
                                 st.session_state[f"editing_feed_{feed.id}"] = False
                                 st.rerun()
@@ -123,17 +148,25 @@ def render_feeds_list(feed_manager: "FeedManager") -> None:
                             st.session_state[f"editing_feed_{feed.id}"] = False
                             st.rerun()
 
-            # Feed statistics
+            # Feed statistics, rendered only on demand — expander bodies run
+            # on every rerun even when collapsed
             if feed.id:
-                stats = feed_manager.get_feed_statistics(feed.id)
-                if stats:
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total Articles", stats.get("total_articles", 0))
-                    with col2:
-                        st.metric("With Content", stats.get("articles_with_content", 0))
-                    with col3:
-                        st.metric("With Summary", stats.get("articles_with_summary", 0))
+                if st.checkbox(
+                    "📊 Show statistics", key=f"show_stats_{feed.id}", value=False
+                ):
+                    stats = stats_map.get(feed.id, {})
+                    if stats:
+                        col1, col2, col3 = st.columns(3)
+                        with col1:
+                            st.metric("Total Articles", stats.get("total_articles", 0))
+                        with col2:
+                            st.metric(
+                                "With Content", stats.get("articles_with_content", 0)
+                            )
+                        with col3:
+                            st.metric(
+                                "With Summary", stats.get("articles_with_summary", 0)
+                            )
 
 
 def render_add_feed_ui(feed_manager: "FeedManager") -> None:
@@ -188,6 +221,7 @@ def render_add_feed_ui(feed_manager: "FeedManager") -> None:
         if add_clicked and feed_url:
             with st.spinner("Adding feed..."):
                 if feed_manager.add_feed(feed_url, feed_title, feed_description):
+                    _load_feeds_and_stats.clear()
                     st.success("✅ Feed added successfully!")
                     st.rerun()
                 else:
@@ -206,7 +240,7 @@ def render_feed_statistics(feed_manager: "FeedManager") -> None:
 
     st.subheader("Feed Statistics Overview")
 
-    feeds = feed_manager.get_all_feeds(include_inactive=False)
+    feeds, stats_map = _load_feeds_and_stats(feed_manager, include_inactive=False)
 
     if not feeds:
         st.info("No feeds to show statistics for.")
@@ -214,11 +248,7 @@ def render_feed_statistics(feed_manager: "FeedManager") -> None:
 
     # Overall metrics
     total_feeds = len(feeds)
-    total_articles = sum(
-        feed_manager.get_feed_statistics(feed.id).get("total_articles", 0)
-        for feed in feeds
-        if feed.id
-    )
+    total_articles = feed_manager.count_articles_from_active_feeds()
 
     col1, col2 = st.columns(2)
     with col1:
@@ -231,7 +261,7 @@ def render_feed_statistics(feed_manager: "FeedManager") -> None:
 
     for feed in feeds:
         if feed.id:
-            stats = feed_manager.get_feed_statistics(feed.id)
+            stats = stats_map.get(feed.id, {})
             if stats:
                 with st.expander(
                     f"📊 {stats.get('feed_title', 'Unknown Feed')}", expanded=False
@@ -292,6 +322,7 @@ def render_deleted_feeds(feed_manager: "FeedManager") -> None:
             with col1:
                 if st.button("♻️ Restore", key=f"restore_{feed.id}"):
                     if feed.id is not None and feed_manager.restore_feed(feed.id):
+                        _load_feeds_and_stats.clear()
                         st.success("Feed restored successfully!")
                         st.rerun()
                     else:
@@ -310,6 +341,7 @@ def render_deleted_feeds(feed_manager: "FeedManager") -> None:
                         if feed.id is not None and feed_manager.permanently_delete_feed(
                             feed.id
                         ):
+                            _load_feeds_and_stats.clear()
                             st.success("Feed permanently deleted!")
                             st.rerun()
                         else:
@@ -6,9 +6,13 @@ daily summary of all news articles from active feeds fetched in the last 24 hour
 as a single cohesive text, rather than individual article listings.
 """
 
+import html
 import streamlit as st
 import logging
-from typing import List
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from ..core.models import Article
@@ -18,6 +22,211 @@ from ..core.config import ConfigManager
 
 logger = logging.getLogger(__name__)
 
+# Articles per map-phase chunk when building the daily summary; chunks are
+# summarized concurrently and the digests reduced in one final call
+SUMMARY_CHUNK_SIZE = 10
+
+# Rough character budget for the combined prompt content; keeps LLM
+# latency and cost bounded when individual articles run long
+PROMPT_CHAR_BUDGET = 20000
+
+# All 21 possible 20-character histogram bars, built once at import
+_BARS = ["█" * n + "▒" * (20 - n) for n in range(21)]
+
+# Prompt template for the daily summary, built once at module load instead
+# of re-assembling the multi-line string on every generation
+_PROMPT_TEMPLATE = """You are a professional news editor creating a comprehensive daily digest. Based on the {n} articles from active news feeds in the last 24 hours below, create a single, cohesive narrative summary that flows naturally from topic to topic.
+
+Requirements:
+1. Write as ONE continuous text (not bullet points or sections)
+2. Start with the most significant breaking news or developments
+3. Connect related stories and themes naturally in the narrative
+4. Include key details, numbers, and quotes where relevant
+5. Transition smoothly between different topics and regions
+6. End with a brief outlook or context for tomorrow
+7. Write in an engaging, journalistic style suitable for an informed reader
+8. Aim for 300-500 words
+
+Focus on creating a flowing narrative that gives readers a complete picture of today's news landscape, as if you were briefing someone who's been away and needs to catch up on everything important that happened today.
+
+Articles to synthesize:
+{content}
+
+Write a comprehensive daily news summary:"""
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Shorten text to the limit with an ellipsis, untouched when short"""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+@lru_cache(maxsize=32)
+def _summary_html(summary: str) -> str:
+    """Escape a summary for the styled HTML container
+
+    The model's output is interpolated under unsafe_allow_html, so any
+    < or & it emits must not be injected raw, and a blank line would
+    otherwise terminate the HTML block and leave the div unclosed.
+    Escaping plus <br> line breaks keeps the whole narrative inside the
+    container; the cache makes reruns skip the conversion.
+    """
+    return html.escape(summary).replace("\n", "<br>")
+
+
+@lru_cache(maxsize=512)
+def _short_display_url(url: str) -> str:
+    """Strip the scheme and truncate a feed URL for display
+
+    The feed set is small and stable, so the cache makes repeat reruns
+    skip the string work entirely.
+    """
+    return _truncate(url.removeprefix("https://").removeprefix("http://"), 30)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def _load_recent_articles(
+    _feed_manager: FeedManager, hours: int, version: Optional[int] = None
+) -> List[Article]:
+    """
+    Load recent articles from active feeds, cached across Streamlit reruns
+
+    Every button on this page triggers a rerun, and each rerun re-queried
+    the database without this cache. The underscore keeps st.cache_data
+    from trying to hash the manager; the version token (highest article ID)
+    invalidates the entry as soon as new articles land, with the TTL as a
+    backstop. _load_recent_articles.clear() still forces a refresh.
+
+    Args:
+        _feed_manager: Feed manager service instance
+        hours: Number of hours to look back
+        version: Cache-busting token; pass the current max article ID
+
+    Returns:
+        List[Article]: Recent articles from active feeds
+    """
+    return _feed_manager.get_recent_articles_from_active_feeds(hours=hours)
+
+
+def _articles_version(feed_manager: FeedManager) -> Optional[int]:
+    """Cheap version token for the article cache (one MAX query)"""
+    try:
+        return feed_manager.repository.articles.get_max_id()
+    except Exception as e:
+        logger.warning(f"Could not read article version token: {e}")
+        return None
+
+
+def _aggregate_article_metrics(articles: List[Article]) -> Dict[str, Any]:
+    """
+    Compute every counter the page needs in one pass over the articles
+
+    Args:
+        articles: Articles to aggregate
+
+    Returns:
+        Dict with content/summary/completion counts, per-feed counts, and
+        hourly counts
+    """
+    with_content = 0
+    with_summary = 0
+    complete = 0
+    feed_counts: Counter = Counter()
+    hourly_counts: Counter = Counter()
+
+    for article in articles:
+        if article.has_content:
+            with_content += 1
+        if article.has_summary:
+            with_summary += 1
+        if article.is_complete:
+            complete += 1
+        feed_counts[article.feed_url] += 1
+        if article.created_at:
+            hourly_counts[article.created_at.hour] += 1
+
+    return {
+        "with_content": with_content,
+        "with_summary": with_summary,
+        "complete": complete,
+        "feed_counts": feed_counts,
+        "hourly_counts": hourly_counts,
+    }
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _preview_sources(
+    top_sources: tuple, _feed_manager: FeedManager
+) -> List[tuple]:
+    """
+    Resolve display titles for the top sources, cached per article set
+
+    Args:
+        top_sources: (feed_url, count) pairs from the fused counters
+        _feed_manager: Feed manager used to resolve feed titles
+
+    Returns:
+        List of (title, count) pairs ready to render
+    """
+    feeds_by_url = {f.url: f for f in _feed_manager.get_all_feeds()}
+    rows = []
+    for feed_url, count in top_sources:
+        feed = feeds_by_url.get(feed_url)
+        feed_title = (feed.title or feed.url) if feed else feed_url
+        rows.append((_truncate(feed_title, 50), count))
+    return rows
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _ai_available(_ai_summarizer: AISummarizer) -> bool:
+    """
+    Check summarizer availability at most once per minute across reruns
+
+    Args:
+        _ai_summarizer: AI summarizer service instance
+
+    Returns:
+        bool: Whether the summarizer can serve requests
+    """
+    return _ai_summarizer.is_available()
+
+
+def _article_fingerprint(articles: List[Article]) -> tuple:
+    """Stable identity of an article set, for summary memoization"""
+    return tuple(sorted(str(article.id or article.link) for article in articles))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_daily_summary(
+    fingerprint: tuple,
+    _articles: List[Article],
+    _ai_summarizer: AISummarizer,
+    _precomputed: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Call the daily-summary model, memoized on the article fingerprint only
+
+    The prompt — including the nondeterministic map-reduce digests — is
+    built inside, so it never participates in the cache key and an
+    unchanged article set always hits. A summary already produced by the
+    streaming path can be handed in via _precomputed to seed the cache
+    without a second generation. The underscores keep everything but the
+    fingerprint out of the hash; the Refresh button clears this cache.
+
+    Args:
+        fingerprint: Stable identity of the summarized articles
+        _articles: Articles to build the prompt from on a miss
+        _ai_summarizer: AI summarizer service instance
+        _precomputed: Summary from the streaming path, to store instead
+            of generating
+
+    Returns:
+        Generated summary text, or None on failure
+    """
+    if _precomputed is not None:
+        return _precomputed
+    prompt = _build_daily_summary_prompt(_articles, _ai_summarizer)
+    return _ai_summarizer.generate_daily_summary(prompt)
+
 
 def render_la_une_page(
     feed_manager: FeedManager, ai_summarizer: AISummarizer, config: ConfigManager
@@ -34,8 +243,13 @@ def render_la_une_page(
     st.header("📰 La Une - Daily News Summary")
     st.subheader("Your comprehensive daily news digest from active feeds")
 
+    # One clock read per rerun, shared by the metric and the summary key
+    now = datetime.now()
+
     # Get recent articles from active feeds only (last 24 hours)
-    recent_articles = feed_manager.get_recent_articles_from_active_feeds(hours=24)
+    recent_articles = _load_recent_articles(
+        feed_manager, hours=24, version=_articles_version(feed_manager)
+    )
 
     if not recent_articles:
         st.info(
@@ -44,34 +258,41 @@ def render_la_une_page(
         if st.button("🔄 Update All Feeds", type="primary", use_container_width=True):
             with st.spinner("Updating feeds..."):
                 results = feed_manager.update_all_feeds()
+                _load_recent_articles.clear()
                 st.success(
                     f"Found {results['new_articles']} new articles from {results['total_feeds']} feeds"
                 )
                 st.rerun()
         return
 
-    # Display basic metrics in a compact row
+    # Display basic metrics in a compact row, aggregated in one pass and
+    # memoized per article set so toggles don't re-walk the list
+    akey = hash(tuple(article.id or article.link for article in recent_articles))
+    cached_metrics = st.session_state.get("la_une_metrics")
+    if not cached_metrics or cached_metrics[0] != akey:
+        cached_metrics = (akey, _aggregate_article_metrics(recent_articles))
+        st.session_state["la_une_metrics"] = cached_metrics
+    metrics = cached_metrics[1]
+    unique_feeds = len(metrics["feed_counts"])
+
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         st.metric("📄 Articles", len(recent_articles))
 
     with col2:
-        articles_with_content = len([a for a in recent_articles if a.has_content])
-        st.metric("📝 Full Content", articles_with_content)
+        st.metric("📝 Full Content", metrics["with_content"])
 
     with col3:
-        unique_feeds = len(set(article.feed_url for article in recent_articles))
         st.metric("📡 Sources", unique_feeds)
 
     with col4:
-        current_time = datetime.now()
-        st.metric("⏰ Last Updated", current_time.strftime("%H:%M"))
+        st.metric("⏰ Last Updated", now.strftime("%H:%M"))
 
     st.markdown("---")
 
     # Main action: Generate or display daily summary
-    if not ai_summarizer.is_available():
+    if not _ai_available(ai_summarizer):
         st.warning(
             "🔑 OpenAI API key required to generate daily summary. Please configure it in the sidebar."
         )
@@ -81,7 +302,11 @@ def render_la_une_page(
         return
 
     # Check if we already have a daily summary
-    daily_summary_key = f"daily_summary_{datetime.now().strftime('%Y-%m-%d')}"
+    daily_summary_key = f"daily_summary_{now.strftime('%Y-%m-%d')}"
+
+    # Full-width slot the generate handler streams into, so the live text
+    # is not squeezed into the narrow button column
+    stream_slot = st.empty()
 
     # Action buttons
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -90,39 +315,77 @@ def render_la_une_page(
         if st.button(
             "🌟 Generate Today's Summary", type="primary", use_container_width=True
         ):
-            with st.spinner(
-                "Analyzing today's news and generating comprehensive summary..."
-            ):
-                daily_summary = generate_comprehensive_daily_summary(
-                    recent_articles, ai_summarizer
+            daily_summary = None
+            fingerprint = _article_fingerprint(recent_articles)
+
+            # Serve the memoized summary when this article set was already
+            # summarized, instead of paying for another generation
+            if fingerprint in st.session_state.get("summary_fingerprints", set()):
+                daily_summary = _cached_daily_summary(
+                    fingerprint, recent_articles, ai_summarizer
                 )
+
+            if not daily_summary:
+                # Stream the summary so text appears from the first token;
+                # fall back to the blocking path if streaming fails
+                with st.spinner("Analyzing today's news..."):
+                    prompt = _build_daily_summary_prompt(
+                        recent_articles, ai_summarizer
+                    )
+                try:
+                    with stream_slot.container():
+                        daily_summary = st.write_stream(
+                            ai_summarizer.generate_daily_summary_stream(prompt)
+                        )
+                except Exception as e:
+                    logger.warning(f"Streaming summary failed, falling back: {e}")
+
+                if not daily_summary:
+                    with st.spinner("Generating comprehensive summary..."):
+                        daily_summary = generate_comprehensive_daily_summary(
+                            recent_articles, ai_summarizer
+                        )
+
                 if daily_summary:
-                    st.session_state[daily_summary_key] = {
-                        "summary": daily_summary,
-                        "generated_at": datetime.now(),
-                        "article_count": len(recent_articles),
-                        "sources_count": unique_feeds,
-                    }
-                    st.success("Daily summary generated!")
-                    st.rerun()
-                else:
-                    st.error("Failed to generate daily summary")
+                    # Seed the cache with the streamed text so the next
+                    # click on the same article set hits it
+                    _cached_daily_summary(
+                        fingerprint,
+                        recent_articles,
+                        ai_summarizer,
+                        _precomputed=daily_summary,
+                    )
+                    st.session_state.setdefault(
+                        "summary_fingerprints", set()
+                    ).add(fingerprint)
+            if daily_summary:
+                st.session_state[daily_summary_key] = {
+                    "summary": daily_summary,
+                    "generated_at": datetime.now(),
+                    "article_count": len(recent_articles),
+                    "sources_count": unique_feeds,
+                }
+                # Rerun so only the styled container below shows the summary;
+                # without this the streamed copy and the display block both
+                # render it in the same run
+                st.rerun()
+            else:
+                st.error("Failed to generate daily summary")
 
     with col2:
         if st.button("🔄 Refresh Summary", use_container_width=True):
-            # Clear cached summary to force regeneration
+            # Clear cached summary and articles to force regeneration; the
+            # summary display below already sees the cleared state this run
             if daily_summary_key in st.session_state:
                 del st.session_state[daily_summary_key]
-            st.rerun()
+            st.session_state.pop("summary_fingerprints", None)
+            _load_recent_articles.clear()
+            _cached_daily_summary.clear()
 
     with col3:
-        show_details = st.session_state.get("show_details", False)
-        if st.button(
-            "📊 Hide Details" if show_details else "📊 Show Details",
-            use_container_width=True,
-        ):
-            st.session_state.show_details = not show_details
-            st.rerun()
+        # State-bound toggle; the click itself already triggers the rerun,
+        # so no explicit st.rerun() (and no double run) is needed
+        st.toggle("📊 Show Details", key="show_details")
 
     # Display the daily summary
     if daily_summary_key in st.session_state:
@@ -136,40 +399,30 @@ def render_la_une_page(
             st.caption(
                 f"📊 Based on {summary_data['article_count']} articles from {summary_data['sources_count']} active sources"
             )
+        generated_time, date_str = (
+            summary_data["generated_at"].strftime("%H:%M|%B %d, %Y").split("|")
+        )
         with col2:
-            generated_time = summary_data["generated_at"].strftime("%H:%M")
             st.caption(f"⏰ Generated at {generated_time}")
         with col3:
-            date_str = summary_data["generated_at"].strftime("%B %d, %Y")
             st.caption(f"📅 {date_str}")
 
         st.markdown("---")
 
-        # The main summary content - prominently displayed
+        # The main summary content - prominently displayed in a single
+        # markdown element instead of three separate wrapper calls
         with st.container():
-            # Use a nice background container for the summary
             st.markdown(
-                """
-                <div style="
-                    background-color: #f0f2f6;
-                    padding: 20px;
-                    border-radius: 10px;
-                    border-left: 5px solid #ff6b6b;
-                    margin: 10px 0;
-                ">
-                """,
+                '<div style="background-color:#f0f2f6;padding:20px;'
+                "border-radius:10px;border-left:5px solid #ff6b6b;"
+                f'margin:10px 0;">{_summary_html(summary_data["summary"])}</div>',
                 unsafe_allow_html=True,
             )
 
-            st.markdown(summary_data["summary"])
-
-            st.markdown("</div>", unsafe_allow_html=True)
-
         # Optional detailed breakdown
         if st.session_state.get("show_details", False):
             st.markdown("---")
-            with st.expander("📊 Detailed Article Breakdown", expanded=True):
-                render_summary_analytics(recent_articles)
+            _analytics_fragment(recent_articles, metrics)
 
     else:
         # Encourage user to generate summary
@@ -181,32 +434,20 @@ def render_la_une_page(
         with st.container():
             st.markdown("### 📋 Ready to Summarize")
             st.write(
-                f"**{len(recent_articles)} articles** from **{len(set(a.feed_url for a in recent_articles))} active sources** are ready to be summarized into your daily digest."
+                f"**{len(recent_articles)} articles** from **{unique_feeds} active sources** are ready to be summarized into your daily digest."
             )
 
             # Show top sources preview
             if st.session_state.get("show_details", False):
-                feed_counts = {}
-                for article in recent_articles:
-                    feed_counts[article.feed_url] = (
-                        feed_counts.get(article.feed_url, 0) + 1
-                    )
+                feed_counts = metrics["feed_counts"]
 
                 if feed_counts:
                     st.markdown("**Preview - Top Sources:**")
-                    sorted_feeds = sorted(
-                        feed_counts.items(), key=lambda x: x[1], reverse=True
-                    )[:5]
-                    for feed_url, count in sorted_feeds:
-                        # Try to get feed title or use URL
-                        feeds = feed_manager.get_all_feeds()
-                        feed_title = next(
-                            (f.title or f.url for f in feeds if f.url == feed_url),
-                            feed_url,
-                        )
-                        # Shorten long feed titles
-                        if len(feed_title) > 50:
-                            feed_title = feed_title[:50] + "..."
+                    # Heap-based top-5, with title resolution cached so
+                    # reruns with details open skip the feeds lookup
+                    for feed_title, count in _preview_sources(
+                        tuple(feed_counts.most_common(5)), feed_manager
+                    ):
                         st.write(f"• {feed_title}: {count} articles")
 
 
@@ -227,94 +468,156 @@ def generate_comprehensive_daily_summary(
         if not articles:
             return "No articles available for summary."
 
-        # Prepare content from articles for summarization
-        articles_content = []
-
-        for article in articles[
-            :50
-        ]:  # Increased limit to 50 articles for better coverage
-            # Use the best available content
-            content = ""
-            if article.has_summary:
-                content = article.summary
-            elif article.has_content:
-                # Truncate long content to avoid token limits
-                content = (
-                    article.content[:1000] + "..."
-                    if len(article.content) > 1000
-                    else article.content
-                )
-            elif article.description:
-                content = article.description
-            else:
-                content = article.title or "No content available"
+        # Generate the summary, memoized on the set of articles so
+        # regenerating over unchanged inputs skips prompt building and
+        # the API call alike
+        fingerprint = _article_fingerprint(articles)
+        summary = _cached_daily_summary(fingerprint, articles, ai_summarizer)
+
+        if not summary:
+            return (
+                "Unable to generate daily summary at this time. Please try again later."
+            )
+
+        return summary
 
-            # Format the article entry with source and timestamp
-            title = article.title or "Untitled"
-            time_info = ""
-            if article.created_at:
-                time_info = f" ({article.created_at.strftime('%H:%M')})"
+    except Exception as e:
+        logger.error(f"Error generating comprehensive daily summary: {e}")
+        return f"Error generating daily summary: {str(e)}"
+
+
+def _build_daily_summary_prompt(
+    articles: List[Article], ai_summarizer: AISummarizer
+) -> str:
+    """
+    Assemble the daily-summary prompt from the articles
 
-            articles_content.append(f"**{title}**{time_info}\n{content}")
+    Args:
+        articles: List of articles to summarize
+        ai_summarizer: AI summarizer, used for the map-phase chunk digests
 
-        # Combine all articles into one text
+    Returns:
+        Full prompt text for the daily summary
+    """
+    # Prepare content from articles for summarization, stopping early
+    # once the cumulative character budget is spent
+    articles_content = []
+    total_chars = 0
+
+    for article in articles[
+        :50
+    ]:  # Increased limit to 50 articles for better coverage
+        # Use the best available content, reading each attribute once
+        content = article.content or ""
+        if article.has_summary:
+            body = article.summary
+        elif content:
+            # Truncate long content to avoid token limits
+            body = content[:1000] + "..." if len(content) > 1000 else content
+        elif article.description:
+            body = article.description
+        else:
+            body = article.title or "No content available"
+
+        # Format the article entry with source and timestamp
+        title = article.title or "Untitled"
+        created_at = article.created_at
+        time_info = f" ({created_at.strftime('%H:%M')})" if created_at else ""
+
+        entry = f"**{title}**{time_info}\n{body}"
+        if articles_content and total_chars + len(entry) > PROMPT_CHAR_BUDGET:
+            break
+        total_chars += len(entry)
+        articles_content.append(entry)
+
+    # Combine all articles into one text; for large batches, map-reduce
+    # through concurrent per-chunk digests so the final call reads a
+    # short reduced input instead of 50 full articles
+    if len(articles_content) > SUMMARY_CHUNK_SIZE:
+        combined_content = _map_reduce_digests(articles_content, ai_summarizer)
+    else:
         combined_content = "\n\n---\n\n".join(articles_content)
 
-        # Create an enhanced prompt for daily summary focused on cohesive narrative
-        prompt = f"""You are a professional news editor creating a comprehensive daily digest. Based on the {len(articles)} articles from active news feeds in the last 24 hours below, create a single, cohesive narrative summary that flows naturally from topic to topic.
+    return _PROMPT_TEMPLATE.format(n=len(articles), content=combined_content)
 
-Requirements:
-1. Write as ONE continuous text (not bullet points or sections)
-2. Start with the most significant breaking news or developments
-3. Connect related stories and themes naturally in the narrative
-4. Include key details, numbers, and quotes where relevant
-5. Transition smoothly between different topics and regions
-6. End with a brief outlook or context for tomorrow
-7. Write in an engaging, journalistic style suitable for an informed reader
-8. Aim for 300-500 words
 
-Focus on creating a flowing narrative that gives readers a complete picture of today's news landscape, as if you were briefing someone who's been away and needs to catch up on everything important that happened today.
+def _map_reduce_digests(entries: List[str], ai_summarizer: AISummarizer) -> str:
+    """
+    Summarize formatted article entries in concurrent chunks
 
-Articles to synthesize:
-{combined_content}
+    Each chunk of SUMMARY_CHUNK_SIZE entries becomes one short model call;
+    the mini-digests are joined for the final reduce prompt. Falls back to
+    the raw entries if every chunk call fails.
 
-Write a comprehensive daily news summary:"""
+    Args:
+        entries: Formatted per-article text blocks
+        ai_summarizer: AI summarizer service instance
+
+    Returns:
+        Joined chunk digests, or the joined raw entries on failure
+    """
+    chunk_prompts = []
+    for start in range(0, len(entries), SUMMARY_CHUNK_SIZE):
+        chunk = "\n\n---\n\n".join(entries[start : start + SUMMARY_CHUNK_SIZE])
+        chunk_prompts.append(
+            "Summarize the key developments from the following news articles "
+            "in 5-8 sentences, keeping important names, numbers, and places:\n\n"
+            f"{chunk}"
+        )
 
-        # Generate the summary using the specialized daily summary method
-        summary = ai_summarizer.generate_daily_summary(prompt)
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        digests = list(
+            executor.map(ai_summarizer.generate_daily_summary, chunk_prompts)
+        )
 
-        if not summary:
-            return (
-                "Unable to generate daily summary at this time. Please try again later."
-            )
+    digests = [digest for digest in digests if digest]
+    if not digests:
+        logger.warning("All chunk digests failed; falling back to raw articles")
+        return "\n\n---\n\n".join(entries)
 
-        return summary
+    return "\n\n---\n\n".join(digests)
 
-    except Exception as e:
-        logger.error(f"Error generating comprehensive daily summary: {e}")
-        return f"Error generating daily summary: {str(e)}"
+
+@st.fragment
+def _analytics_fragment(
+    articles: List[Article], metrics: Optional[Dict[str, Any]] = None
+) -> None:
+    """Render the article breakdown in its own rerun scope
+
+    Interacting with the expander reruns only this fragment, so the
+    summary generation and feed lookups above it are not re-executed.
+    """
+    with st.expander("📊 Detailed Article Breakdown", expanded=True):
+        render_summary_analytics(articles, metrics)
 
 
-def render_summary_analytics(articles: List[Article]) -> None:
+def render_summary_analytics(
+    articles: List[Article], metrics: Optional[Dict[str, Any]] = None
+) -> None:
     """
     Render a simplified analytics section for the daily summary
 
     Args:
         articles: List of articles to analyze
+        metrics: Precomputed counters from _aggregate_article_metrics;
+            computed here when not provided
     """
     if not articles:
         st.write("No articles to analyze.")
         return
 
+    if metrics is None:
+        metrics = _aggregate_article_metrics(articles)
+
     col1, col2 = st.columns(2)
 
     with col1:
         st.markdown("**📊 Content Status**")
 
-        # Content status breakdown
-        with_content = len([a for a in articles if a.has_content])
-        with_summary = len([a for a in articles if a.has_summary])
-        complete = len([a for a in articles if a.is_complete])
+        # Content status breakdown, all from the fused counters
+        with_content = metrics["with_content"]
+        with_summary = metrics["with_summary"]
+        complete = metrics["complete"]
 
         st.write(f"• Articles with full content: {with_content}")
         st.write(f"• Articles with AI summary: {with_summary}")
@@ -330,21 +633,13 @@ def render_summary_analytics(articles: List[Article]) -> None:
         st.markdown("**📡 Top Sources**")
 
         # Source distribution
-        feed_counts = {}
-        for article in articles:
-            feed_counts[article.feed_url] = feed_counts.get(article.feed_url, 0) + 1
+        feed_counts = metrics["feed_counts"]
 
-        # Sort and show top 5 sources
+        # Show top 5 sources via heap-based partial selection
         if feed_counts:
-            sorted_feeds = sorted(
-                feed_counts.items(), key=lambda x: x[1], reverse=True
-            )[:5]
+            sorted_feeds = feed_counts.most_common(5)
             for i, (feed_url, count) in enumerate(sorted_feeds, 1):
-                # Shorten URL for display
-                display_url = feed_url.replace("https://", "").replace("http://", "")
-                if len(display_url) > 30:
-                    display_url = display_url[:30] + "..."
-                st.write(f"{i}. {display_url}: {count} articles")
+                st.write(f"{i}. {_short_display_url(feed_url)}: {count} articles")
         else:
             st.write("No source data available")
 
@@ -352,11 +647,7 @@ def render_summary_analytics(articles: List[Article]) -> None:
     st.markdown("**⏰ Timeline**")
 
     # Group articles by hour
-    hourly_counts = {}
-    for article in articles:
-        if article.created_at:
-            hour = article.created_at.hour
-            hourly_counts[hour] = hourly_counts.get(hour, 0) + 1
+    hourly_counts = metrics["hourly_counts"]
 
     if hourly_counts:
         # Create a simple text-based timeline
@@ -364,7 +655,7 @@ def render_summary_analytics(articles: List[Article]) -> None:
         for hour in sorted(hourly_counts.keys()):
             count = hourly_counts[hour]
             bar_length = int((count / max_count) * 20)  # Scale to 20 characters
-            bar = "█" * bar_length + "▒" * (20 - bar_length)
+            bar = _BARS[bar_length]
             st.write(f"{hour:02d}:00 │{bar}│ {count} articles")
     else:
         st.write("No timeline data available")
@@ -2,14 +2,35 @@
 Pytest configuration for the News Aggregator tests.
 """
 
+import copy
 import pytest
 import tempfile
 import os
 from pathlib import Path
-from sqlmodel import create_engine, Session
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine, Session
 from src.core.config import ConfigManager
+from src.core.models import Article, Feed
 from src.core.repository import NewsRepository
-from src.core.database import init_database
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _fast_sqlite():
+    """Disable fsync on every SQLite database opened during the test run"""
+    # The integration tests and the config tests go through file-backed
+    # databases; durability is pointless for throwaway test data, so drop
+    # the journal and synchronous writes to memory speed for all engines
+    @event.listens_for(Engine, "connect")
+    def _set_speed_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
+    yield
+    event.remove(Engine, "connect", _set_speed_pragmas)
 
 
 @pytest.fixture(scope="function")
@@ -37,10 +58,47 @@ def test_db_url():
     return f"sqlite:///{db_path}"
 
 
+@pytest.fixture(scope="session")
+def test_engine():
+    """Create the shared in-memory repository test engine once per session"""
+    # In-memory with a StaticPool (every checkout is the same connection)
+    # keeps repository tests off the filesystem entirely; the schema is
+    # created directly on this engine rather than through init_database,
+    # which would build it on a separate engine and a separate memory DB
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+
+    # pysqlite's default transaction handling breaks SAVEPOINTs; take over
+    # transaction control so the per-test savepoint rollback works
+    # (see the SQLAlchemy pysqlite "serializable" recipe)
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_autocommit(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _begin_sqlite_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _config_prototype():
+    """Construct ConfigManager once per session; tests receive copies"""
+    return ConfigManager()
+
+
 @pytest.fixture(scope="function")
-def test_config(test_db_url):
+def test_config(_config_prototype, test_db_url):
     """Create a test configuration"""
-    config = ConfigManager()
+    # Deep-copy the prototype instead of re-reading settings, the API key
+    # cache and the database on every test
+    config = copy.deepcopy(_config_prototype)
     config.database.url = test_db_url
     return config
 
@@ -54,21 +112,20 @@ def isolated_config(test_db_url, clean_env):
 
 
 @pytest.fixture(scope="function")
-def test_repository(test_db_url):
-    """Create a fresh test repository for each test"""
-    # Initialize test database
-    init_database(test_db_url)
+def test_repository(test_engine):
+    """Create an isolated test repository for each test"""
+    # One connection with an outer transaction per test; repository commits
+    # become savepoint releases, and the rollback below undoes everything,
+    # so tests stay isolated without rebuilding the schema each time
+    connection = test_engine.connect()
+    transaction = connection.begin()
 
-    # Create repository with session pointing to test database
     repository = NewsRepository()
 
-    # Override the session to use our test database
-    engine = create_engine(test_db_url)
-
-    # Patch the get_session method to use our test engine
+    # Patch the get_session method to use the test connection
     def test_get_session():
         # Create a new session each time, just like the original implementation
-        return Session(engine)
+        return Session(bind=connection, join_transaction_mode="create_savepoint")
 
     repository.articles.get_session = test_get_session
     repository.feeds.get_session = test_get_session
@@ -77,7 +134,8 @@ def test_repository(test_db_url):
     yield repository
 
     # Cleanup
-    engine.dispose()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture(scope="function")
@@ -99,3 +157,23 @@ def sample_article_data():
         "published": "2025-06-26T00:00:00Z",
         "feed_url": "https://feeds.bbci.co.uk/news/rss.xml",
     }
+
+
+@pytest.fixture(scope="function")
+def article_factory(sample_article_data):
+    """Build Article objects from the sample data with field overrides"""
+
+    def _make(**overrides):
+        return Article(**{**sample_article_data, **overrides})
+
+    return _make
+
+
+@pytest.fixture(scope="function")
+def feed_factory(sample_feed_data):
+    """Build Feed objects from the sample data with field overrides"""
+
+    def _make(**overrides):
+        return Feed(**{**sample_feed_data, **overrides})
+
+    return _make
@@ -3,10 +3,42 @@ Test AI summarization functionality.
 """
 
 import pytest
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from src.core.models import Article, AIModelInfo
 from src.services.ai_summarizer import AISummarizer
 
+# Built once; tests never mutate it, so every mock_config can share it
+_TEST_MODELS = [
+    AIModelInfo(
+        model_id="gpt-4o-mini",
+        display_name="GPT-4o Mini",
+        description="Test model",
+        cost_tier="low",
+        max_tokens=4096,
+    )
+]
+
+
+# Lightweight stand-in for Article carrying the fields bulk_summarize
+# reads: id, title, description and content
+_FakeArticle = namedtuple("_FakeArticle", "id title description content")
+
+
+@pytest.fixture(scope="module")
+def _openai_patch():
+    """Patch the OpenAI constructor once per module instead of per test"""
+    with patch("src.services.ai_summarizer.openai.OpenAI") as mock_openai:
+        yield mock_openai
+
+
+@pytest.fixture
+def openai_class(_openai_patch):
+    """Hand tests the patched OpenAI class, reset between tests"""
+    yield _openai_patch
+    _openai_patch.reset_mock(return_value=True, side_effect=True)
+
 
 class TestAISummarizer:
     """Test the AISummarizer class"""
@@ -17,40 +49,38 @@ class TestAISummarizer:
         config = Mock()
         config.get_openai_api_key.return_value = "test-api-key"
         config.get_bulk_summarize_limit.return_value = 10  # Default limit
-        config.ai_config.selected_model = "gpt-4o-mini"
-        config.ai_config.max_summary_length = 500
-        config.ai_config.temperature = 0.3
-        config.ai_config.timeout = 30
-        config.get_available_models.return_value = [
-            AIModelInfo(
-                model_id="gpt-4o-mini",
-                display_name="GPT-4o Mini",
-                description="Test model",
-                cost_tier="low",
-                max_tokens=4096,
-            )
-        ]
+        # Plain namespace for the data-only section; Mock stays for the
+        # methods the tests assert on
+        config.ai_config = SimpleNamespace(
+            selected_model="gpt-4o-mini",
+            max_summary_length=500,
+            temperature=0.3,
+            timeout=30,
+            skip_short_content=False,  # Exercise the API path
+            requests_per_minute=0,  # No pacing delays in tests
+        )
+        config.get_available_models.return_value = _TEST_MODELS
         config.get_known_working_models.return_value = []
         config.set_known_working_models = Mock()
         return config
 
     @pytest.fixture
-    def ai_summarizer(self, mock_config, test_repository):
+    def ai_summarizer(self, mock_config, test_repository, openai_class):
         """Create AISummarizer instance for testing"""
-        with patch("src.services.ai_summarizer.openai.OpenAI"):
-            return AISummarizer(mock_config, test_repository)
+        return AISummarizer(mock_config, test_repository)
 
-    def test_initialization_with_api_key(self, mock_config, test_repository):
+    def test_initialization_with_api_key(
+        self, mock_config, test_repository, openai_class
+    ):
         """Test AISummarizer initialization with API key"""
-        with patch("src.services.ai_summarizer.openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
+        mock_client = Mock()
+        openai_class.return_value = mock_client
 
-            summarizer = AISummarizer(mock_config, test_repository)
+        summarizer = AISummarizer(mock_config, test_repository)
 
-            assert summarizer.config == mock_config
-            assert summarizer.repository == test_repository
-            assert summarizer.client == mock_client
+        assert summarizer.config == mock_config
+        assert summarizer.repository == test_repository
+        assert summarizer.client == mock_client
 
     def test_initialization_without_api_key(self, test_repository):
         """Test AISummarizer initialization without API key"""
@@ -71,17 +101,16 @@ class TestAISummarizer:
         ai_summarizer.client = None
         assert ai_summarizer.is_available() is False
 
-    def test_update_api_key(self, ai_summarizer, mock_config):
+    def test_update_api_key(self, ai_summarizer, mock_config, openai_class):
         """Test updating API key"""
-        with patch("src.services.ai_summarizer.openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
+        mock_client = Mock()
+        openai_class.return_value = mock_client
 
-            result = ai_summarizer.update_api_key("new-test-key")
+        result = ai_summarizer.update_api_key("new-test-key")
 
-            assert result is True
-            mock_config.set_openai_api_key.assert_called_with("new-test-key")
-            assert ai_summarizer.client == mock_client
+        assert result is True
+        mock_config.set_openai_api_key.assert_called_with("new-test-key")
+        assert ai_summarizer.client == mock_client
 
     def test_generate_summary_success(self, ai_summarizer):
         """Test successful summary generation"""
@@ -100,41 +129,57 @@ class TestAISummarizer:
         assert summary == "This is a test summary."
         ai_summarizer.client.chat.completions.create.assert_called_once()
 
-    def test_generate_summary_no_client(self, ai_summarizer):
-        """Test summary generation without client"""
-        ai_summarizer.client = None
+    def test_generate_summary_short_content_skips_api(
+        self, ai_summarizer, mock_config
+    ):
+        """Test that short content is returned as-is without an API call"""
+        mock_config.ai_config.skip_short_content = True
+        ai_summarizer.client = Mock()
 
-        summary = ai_summarizer.generate_summary("Test content", "Test Title")
+        summary = ai_summarizer.generate_summary("  Short content  ", "Test Title")
 
-        assert "unavailable" in summary.lower()
+        assert summary == "Short content"
+        ai_summarizer.client.chat.completions.create.assert_not_called()
 
-    def test_generate_summary_api_error(self, ai_summarizer):
-        """Test summary generation with API error"""
-        ai_summarizer.client = Mock()
-        ai_summarizer.client.chat.completions.create.side_effect = Exception(
-            "API Error"
-        )
+    @pytest.mark.parametrize(
+        "failure_mode,expected",
+        [
+            ("no_client", "unavailable"),
+            ("api_error", "error generating summary"),
+        ],
+    )
+    def test_generate_summary_failures(
+        self, ai_summarizer, monkeypatch, failure_mode, expected
+    ):
+        """Test summary generation error paths"""
+        if failure_mode == "no_client":
+            ai_summarizer.client = None
+        else:
+            ai_summarizer.client = Mock()
+            ai_summarizer.client.chat.completions.create.side_effect = Exception(
+                "API Error"
+            )
+            monkeypatch.setattr(
+                ai_summarizer, "test_model_availability", lambda *a, **k: True
+            )
 
-        with patch.object(ai_summarizer, "test_model_availability", return_value=True):
-            summary = ai_summarizer.generate_summary("Test content", "Test Title")
+        summary = ai_summarizer.generate_summary("Test content", "Test Title")
 
-        assert "Error generating summary" in summary
+        assert expected in summary.lower()
 
     def test_summarize_article_success(
-        self, ai_summarizer, test_repository, sample_article_data
+        self, ai_summarizer, test_repository, article_factory, monkeypatch
     ):
         """Test successful article summarization"""
         # Create article with content
-        article_data = sample_article_data.copy()
-        article_data["content"] = "This is test content for summarization."
-        article = Article(**article_data)
+        article = article_factory(content="This is test content for summarization.")
         saved_article = test_repository.articles.save(article)
 
         # Mock successful summary generation
-        with patch.object(
-            ai_summarizer, "generate_summary", return_value="Test summary"
-        ):
-            success = ai_summarizer.summarize_article(saved_article.id)
+        monkeypatch.setattr(
+            ai_summarizer, "generate_summary", lambda *a, **k: "Test summary"
+        )
+        success = ai_summarizer.summarize_article(saved_article.id)
 
         assert success
 
@@ -160,31 +205,34 @@ class TestAISummarizer:
 
         assert not success
 
-    def test_bulk_summarize(self, ai_summarizer, test_repository, sample_article_data):
+    def test_bulk_summarize(
+        self, ai_summarizer, test_repository, article_factory, monkeypatch
+    ):
         """Test bulk summarization"""
-        # Create multiple articles with content but no summaries
-        articles = []
-        for i in range(3):
-            article_data = sample_article_data.copy()
-            article_data["title"] = f"Article {i + 1}"
-            article_data["link"] = f"https://example.com/article{i + 1}"
-            article_data["content"] = f"Content for article {i + 1}"
-            article = Article(**article_data)
-            saved_article = test_repository.articles.save(article)
-            articles.append(saved_article)
+        # Create multiple articles with content but no summaries in one batch
+        articles = [
+            article_factory(
+                title=f"Article {i + 1}",
+                link=f"https://example.com/article{i + 1}",
+                content=f"Content for article {i + 1}",
+            )
+            for i in range(3)
+        ]
+        links = [article.link for article in articles]
+        assert test_repository.articles.save_bulk(articles) == 3
 
         # Mock successful summary generation
-        with patch.object(
-            ai_summarizer, "generate_summary", return_value="Test summary"
-        ):
-            count = ai_summarizer.bulk_summarize(limit=5)
+        monkeypatch.setattr(
+            ai_summarizer, "generate_summary", lambda *a, **k: "Test summary"
+        )
+        count = ai_summarizer.bulk_summarize(limit=5)
 
         assert count == 3  # Should have summarized all 3 articles
 
-        # Verify all articles have summaries
-        for article in articles:
-            updated_article = test_repository.articles.get_by_id(article.id)
-            assert updated_article.summary == "Test summary"
+        # Verify all articles have summaries with one batched lookup
+        updated_by_link = test_repository.articles.get_by_links(links)
+        for link in links:
+            assert updated_by_link[link].summary == "Test summary"
 
     def test_bulk_summarize_no_client(self, ai_summarizer):
         """Test bulk summarization without client"""
@@ -220,60 +268,40 @@ class TestAISummarizer:
 
         assert model == "gpt-4o-mini"
 
-    def test_bulk_summarize_uses_config_default(self, mock_config):
-        """Test that bulk_summarize uses config default when no limit specified"""
-        # Set up mock config to return a specific limit
+    @pytest.mark.parametrize(
+        "explicit_limit,expected_limit", [(None, 15), (5, 5)]
+    )
+    def test_bulk_summarize_limit_resolution(
+        self, mock_config, monkeypatch, openai_class, explicit_limit, expected_limit
+    ):
+        """Test limit resolution: config default vs explicit argument"""
+        # Set up mock config (only consulted when no explicit limit is given)
         mock_config.get_bulk_summarize_limit.return_value = 15
 
-        # Create mock repository
+        # Create mock repository returning articles the summary loop can read
         mock_repository = Mock()
-        mock_articles = [Mock(id=i, content=f"Content {i}") for i in range(1, 11)]
+        mock_articles = [
+            _FakeArticle(i, f"Title {i}", "", f"Content {i}") for i in range(1, 11)
+        ]
         mock_repository.articles.get_without_summary.return_value = mock_articles
+        mock_repository.articles.update_summary_bulk.return_value = len(mock_articles)
 
-        with patch("src.services.ai_summarizer.openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer(mock_config, mock_repository)
+        summarizer = AISummarizer(mock_config, mock_repository)
 
-            # Mock generate_summary to return success
-            with patch.object(
-                summarizer, "generate_summary", return_value="Test summary"
-            ):
-                with patch.object(summarizer, "summarize_article", return_value=True):
-                    summarizer.bulk_summarize()  # No limit parameter
+        # Mock generation to succeed without nested patch blocks
+        monkeypatch.setattr(
+            summarizer, "generate_summary", lambda *a, **k: "Test summary"
+        )
 
-            # Verify that get_bulk_summarize_limit was called
+        if explicit_limit is None:
+            count = summarizer.bulk_summarize()
             mock_config.get_bulk_summarize_limit.assert_called_once()
-
-            # Verify that get_without_summary was called with the config limit
-            mock_repository.articles.get_without_summary.assert_called_with(15)
-
-    def test_bulk_summarize_with_explicit_limit(self, mock_config):
-        """Test that bulk_summarize uses explicit limit when provided"""
-        # Set up mock config (shouldn't be called when explicit limit is provided)
-        mock_config.get_bulk_summarize_limit.return_value = 15
-
-        # Create mock repository
-        mock_repository = Mock()
-        mock_articles = [Mock(id=i, content=f"Content {i}") for i in range(1, 6)]
-        mock_repository.articles.get_without_summary.return_value = mock_articles
-
-        with patch("src.services.ai_summarizer.openai.OpenAI") as mock_openai:
-            mock_client = Mock()
-            mock_openai.return_value = mock_client
-
-            summarizer = AISummarizer(mock_config, mock_repository)
-
-            # Mock generate_summary to return success
-            with patch.object(
-                summarizer, "generate_summary", return_value="Test summary"
-            ):
-                with patch.object(summarizer, "summarize_article", return_value=True):
-                    summarizer.bulk_summarize(limit=5)  # Explicit limit
-
-            # Verify that get_bulk_summarize_limit was NOT called
+        else:
+            count = summarizer.bulk_summarize(limit=explicit_limit)
             mock_config.get_bulk_summarize_limit.assert_not_called()
 
-            # Verify that get_without_summary was called with the explicit limit
-            mock_repository.articles.get_without_summary.assert_called_with(5)
+        # The loop ran to the batched update rather than dying in its except
+        assert count == len(mock_articles)
+
+        # Verify that get_without_summary received the resolved limit
+        mock_repository.articles.get_without_summary.assert_called_with(expected_limit)
@@ -1,7 +1,11 @@
 """
 Test configuration management functionality.
+
+PYTEST_DONT_REWRITE
 """
 
+import copy
+import pytest
 from src.core.config import (
     ConfigManager,
     DatabaseConfig,
@@ -14,6 +18,11 @@ from src.core.config import (
 class TestConfigManager:
     """Test the ConfigManager class"""
 
+    @pytest.fixture
+    def config(self, _config_prototype):
+        """Copy the session prototype instead of re-running ConfigManager()"""
+        return copy.deepcopy(_config_prototype)
+
     def test_default_initialization(self, isolated_config):
         """Test that ConfigManager initializes with default values"""
         config = isolated_config
@@ -49,10 +58,8 @@ class TestConfigManager:
         assert not config.has_openai_api_key()
         assert config.get_openai_api_key() is None
 
-    def test_model_management(self):
+    def test_model_management(self, config):
         """Test AI model management"""
-        config = ConfigManager()
-
         # Test getting available models
         models = config.get_available_models()
         assert len(models) > 0
@@ -66,9 +73,8 @@ class TestConfigManager:
         assert not config.set_selected_model("invalid-model")
         assert config.get_selected_model() == "gpt-4o"  # Should remain unchanged
 
-    def test_default_feeds(self):
+    def test_default_feeds(self, config):
         """Test default feeds list"""
-        config = ConfigManager()
         default_feeds = config.get_default_feeds()
 
         assert len(default_feeds) > 0
@@ -97,63 +103,82 @@ class TestConfigManager:
                 or ai_config.get("openai_api_key") is None
             )
 
-    def test_bulk_summarize_limit_management(self, isolated_config):
+    def test_bulk_summarize_limit_initial(self, isolated_config):
+        """Test that the initial bulk summarize limit is positive"""
+        # Might not be 10 if tests are not isolated, but must be positive
+        assert isolated_config.get_bulk_summarize_limit() > 0
+
+    @pytest.mark.parametrize(
+        "value,accepted,expected_read",
+        [
+            (20, True, 20),
+            (1, True, 1),
+            (100, True, 100),
+            (0, False, 100),
+            (-5, False, 100),
+        ],
+    )
+    def test_bulk_summarize_limit_management(
+        self, isolated_config, value, accepted, expected_read
+    ):
         """Test bulk summarize limit setting and retrieval"""
         config = isolated_config
 
-        # Get initial value (might not be 10 if tests are not isolated)
-        initial_limit = config.get_bulk_summarize_limit()
-        assert initial_limit > 0  # Should be a positive value
-
-        # Test setting valid values
-        assert config.set_bulk_summarize_limit(20) is True
-        assert config.get_bulk_summarize_limit() == 20
-
-        assert config.set_bulk_summarize_limit(1) is True
-        assert config.get_bulk_summarize_limit() == 1
-
+        # Known starting point so rejected values leave 100 in place
         assert config.set_bulk_summarize_limit(100) is True
-        assert config.get_bulk_summarize_limit() == 100
 
-        # Test invalid values
-        assert config.set_bulk_summarize_limit(0) is False
-        assert config.get_bulk_summarize_limit() == 100  # Should remain unchanged
-
-        assert config.set_bulk_summarize_limit(-5) is False
-        assert config.get_bulk_summarize_limit() == 100  # Should remain unchanged
+        assert config.set_bulk_summarize_limit(value) is accepted
+        assert config.get_bulk_summarize_limit() == expected_read
 
 
 class TestConfigDataClasses:
     """Test the configuration dataclasses"""
 
-    def test_database_config(self):
-        """Test DatabaseConfig defaults"""
+    def test_database_config_url(self):
+        """Test DatabaseConfig default URL"""
         config = DatabaseConfig()
         assert "sqlite:///" in config.url
-        assert config.backup_enabled is True
-        assert config.backup_interval == 86400
-
-    def test_ai_config(self):
-        """Test AIConfig defaults"""
-        config = AIConfig()
-        assert config.openai_api_key is None
-        assert config.selected_model == "gpt-4o-mini"
-        assert config.max_summary_length == 500
-        assert config.temperature == 0.3
-        assert config.timeout == 30
-
-    def test_feed_config(self):
-        """Test FeedConfig defaults"""
-        config = FeedConfig()
-        assert config.default_fetch_interval == 3600
-        assert config.max_articles_per_feed == 100
-        assert config.concurrent_fetches == 5
-        assert config.request_timeout == 30
-
-    def test_ui_config(self):
-        """Test UIConfig defaults"""
-        config = UIConfig()
-        assert config.items_per_page == 20
-        assert config.theme == "light"
-        assert config.sidebar_expanded is True
-        assert config.max_content_length == 10000
+
+    @pytest.mark.parametrize(
+        "config_cls,expected_defaults",
+        [
+            (
+                DatabaseConfig,
+                {"backup_enabled": True, "backup_interval": 86400},
+            ),
+            (
+                AIConfig,
+                {
+                    "openai_api_key": None,
+                    "selected_model": "gpt-4o-mini",
+                    "max_summary_length": 500,
+                    "temperature": 0.3,
+                    "timeout": 30,
+                    "skip_short_content": True,
+                },
+            ),
+            (
+                FeedConfig,
+                {
+                    "default_fetch_interval": 3600,
+                    "max_articles_per_feed": 100,
+                    "concurrent_fetches": 5,
+                    "request_timeout": 30,
+                },
+            ),
+            (
+                UIConfig,
+                {
+                    "items_per_page": 20,
+                    "theme": "light",
+                    "sidebar_expanded": True,
+                    "max_content_length": 10000,
+                },
+            ),
+        ],
+    )
+    def test_dataclass_defaults(self, config_cls, expected_defaults):
+        """Test configuration dataclass defaults"""
+        config = config_cls()
+        for field, value in expected_defaults.items():
+            assert getattr(config, field) == value
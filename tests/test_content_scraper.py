@@ -3,11 +3,63 @@ Test content scraping functionality.
 """
 
 import pytest
+from dataclasses import dataclass
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 import requests
 from src.core.models import Article, ArticleStatus
 from src.services.content_scraper import ContentScraper
 
+# Static HTML payloads shared by the scraping tests, built once at import
+_HTML_ARTICLE = b"""
+        <html>
+            <body>
+                <article>
+                    <h1>Test Article</h1>
+                    <p>This is the first paragraph of content.</p>
+                    <p>This is the second paragraph with more content.</p>
+                </article>
+            </body>
+        </html>
+        """
+_HTML_SHORT = b"<html><body><p>Short</p></body></html>"
+
+
+class _FakeRaw:
+    """Minimal stand-in for the urllib3 response stream"""
+
+    def __init__(self, payload: bytes):
+        self._payload = payload
+
+    def read(self, amt=None, decode_content=True):
+        return self._payload
+
+
+@dataclass
+class _FakeResponse:
+    """Data-only response stub; the scraper just reads these fields"""
+
+    status_code: int
+    headers: dict
+    raw: _FakeRaw
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            # Attach the response like requests does, so the scraper's
+            # handler can read e.response.status_code
+            raise requests.exceptions.HTTPError(response=self)
+
+    def close(self):
+        pass
+
+
+def _html_response(payload: bytes) -> _FakeResponse:
+    return _FakeResponse(
+        status_code=200,
+        headers={"content-type": "text/html; charset=utf-8"},
+        raw=_FakeRaw(payload),
+    )
+
 
 class TestContentScraper:
     """Test the ContentScraper class"""
@@ -16,8 +68,8 @@ class TestContentScraper:
     def mock_config(self):
         """Mock configuration for testing"""
         config = Mock()
-        config.feeds.request_timeout = 30
-        config.ui.max_content_length = 10000
+        config.feeds = SimpleNamespace(request_timeout=30)
+        config.ui = SimpleNamespace(max_content_length=10000)
         return config
 
     @pytest.fixture
@@ -35,22 +87,7 @@ class TestContentScraper:
     def test_scrape_article_content_success(self, mock_get, content_scraper):
         """Test successful content scraping"""
         # Mock successful HTTP response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
-        mock_response.content = b"""
-        <html>
-            <body>
-                <article>
-                    <h1>Test Article</h1>
-                    <p>This is the first paragraph of content.</p>
-                    <p>This is the second paragraph with more content.</p>
-                </article>
-            </body>
-        </html>
-        """
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = _html_response(_HTML_ARTICLE)
 
         # Test scraping
         url = "https://example.com/article"
@@ -66,12 +103,7 @@ class TestContentScraper:
     def test_scrape_article_content_no_content(self, mock_get, content_scraper):
         """Test scraping with minimal content"""
         # Mock response with very little content
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {"content-type": "text/html; charset=utf-8"}
-        mock_response.content = b"<html><body><p>Short</p></body></html>"
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = _html_response(_HTML_SHORT)
 
         # Test scraping
         url = "https://example.com/article"
@@ -81,22 +113,17 @@ class TestContentScraper:
         assert content is None
 
     @patch("src.services.content_scraper.requests.Session.get")
-    def test_scrape_article_content_timeout(self, mock_get, content_scraper):
-        """Test scraping with timeout error"""
-        mock_get.side_effect = requests.exceptions.Timeout()
-
-        url = "https://example.com/article"
-        content = content_scraper.scrape_article_content(url)
-
-        assert content is None
-
-    @patch("src.services.content_scraper.requests.Session.get")
-    def test_scrape_article_content_http_error(self, mock_get, content_scraper):
-        """Test scraping with HTTP error"""
-        mock_response = Mock()
-        mock_response.status_code = 404
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
-        mock_get.return_value = mock_response
+    @pytest.mark.parametrize("failure_mode", ["timeout", "http_error"])
+    def test_scrape_article_content_failures(
+        self, mock_get, content_scraper, failure_mode
+    ):
+        """Test scraping error paths return None"""
+        if failure_mode == "timeout":
+            mock_get.side_effect = requests.exceptions.Timeout()
+        else:
+            mock_get.return_value = _FakeResponse(
+                status_code=404, headers={}, raw=_FakeRaw(b"")
+            )
 
         url = "https://example.com/article"
         content = content_scraper.scrape_article_content(url)
@@ -172,17 +199,17 @@ class TestContentScraper:
 
         assert not success
 
-    def test_bulk_scrape(self, content_scraper, test_repository, sample_article_data):
+    def test_bulk_scrape(self, content_scraper, test_repository, article_factory):
         """Test bulk scraping functionality"""
-        # Create multiple articles without content
-        articles = []
-        for i in range(3):
-            article_data = sample_article_data.copy()
-            article_data["title"] = f"Article {i + 1}"
-            article_data["link"] = f"https://example.com/article{i + 1}"
-            article = Article(**article_data)
-            saved_article = test_repository.articles.save(article)
-            articles.append(saved_article)
+        # Create multiple articles without content in one batch
+        articles = [
+            article_factory(
+                title=f"Article {i + 1}", link=f"https://example.com/article{i + 1}"
+            )
+            for i in range(3)
+        ]
+        links = [article.link for article in articles]
+        assert test_repository.articles.save_bulk(articles) == 3
 
         # Mock successful scraping for all articles
         test_content = "Bulk scraped content"
@@ -193,11 +220,11 @@ class TestContentScraper:
 
         assert count == 3  # Should have scraped all 3 articles
 
-        # Verify all articles have content
-        for article in articles:
-            updated_article = test_repository.articles.get_by_id(article.id)
-            assert updated_article.content == test_content
-            assert updated_article.status == ArticleStatus.SCRAPED
+        # Verify all articles have content with one batched lookup
+        updated_by_link = test_repository.articles.get_by_links(links)
+        for link in links:
+            assert updated_by_link[link].content == test_content
+            assert updated_by_link[link].status == ArticleStatus.SCRAPED
 
     def test_bulk_scrape_no_articles(self, content_scraper, test_repository):
         """Test bulk scraping with no articles needing content"""
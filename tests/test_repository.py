@@ -2,6 +2,7 @@
 Test repository functionality.
 """
 
+import pytest
 from src.core.models import Article, Feed, ArticleStatus, FeedStatus
 
 
@@ -37,51 +38,27 @@ class TestArticleRepository:
         assert retrieved_article is not None
         assert retrieved_article.id == saved_article.id
 
-    def test_get_without_content(self, test_repository, sample_article_data):
-        """Test retrieving articles without content"""
-        # Create articles - one with content, one without
-        article1 = Article(**sample_article_data)
-        article1.content = "This article has content"
-
-        article2_data = sample_article_data.copy()
-        article2_data["title"] = "Article without content"
-        article2_data["link"] = "https://example.com/article2"
-        article2 = Article(**article2_data)
-        # article2.content remains None
-
-        # Save both articles
-        test_repository.articles.save(article1)
-        test_repository.articles.save(article2)
-
-        # Get articles without content
-        articles_without_content = test_repository.articles.get_without_content()
-
-        # Should only return article2
-        assert len(articles_without_content) == 1
-        assert articles_without_content[0].title == "Article without content"
-
-    def test_get_without_summary(self, test_repository, sample_article_data):
-        """Test retrieving articles without summary"""
-        # Create articles - one with summary, one without
-        article1 = Article(**sample_article_data)
-        article1.summary = "This is a summary"
-
-        article2_data = sample_article_data.copy()
-        article2_data["title"] = "Article without summary"
-        article2_data["link"] = "https://example.com/article2"
-        article2 = Article(**article2_data)
-        # article2.summary remains None
-
-        # Save both articles
-        test_repository.articles.save(article1)
-        test_repository.articles.save(article2)
+    @pytest.mark.parametrize(
+        "field,query_name",
+        [("content", "get_without_content"), ("summary", "get_without_summary")],
+    )
+    def test_get_without_field(
+        self, test_repository, article_factory, field, query_name
+    ):
+        """Test retrieving articles missing content or summary"""
+        # Create articles - one with the field set, one without
+        article1 = article_factory(**{field: f"This article has {field}"})
+        article2 = article_factory(
+            title=f"Article without {field}", link="https://example.com/article2"
+        )
 
-        # Get articles without summary
-        articles_without_summary = test_repository.articles.get_without_summary()
+        # Save both articles in one batch
+        assert test_repository.articles.save_bulk([article1, article2]) == 2
 
         # Should only return article2
-        assert len(articles_without_summary) == 1
-        assert articles_without_summary[0].title == "Article without summary"
+        results = getattr(test_repository.articles, query_name)()
+        assert len(results) == 1
+        assert results[0].title == f"Article without {field}"
 
     def test_update_content(self, test_repository, sample_article_data):
         """Test updating article content"""
@@ -119,21 +96,18 @@ class TestArticleRepository:
         assert updated_article.summary == test_summary
         assert updated_article.status == ArticleStatus.SUMMARIZED
 
-    def test_get_by_status(self, test_repository, sample_article_data):
+    def test_get_by_status(self, test_repository, sample_article_data, article_factory):
         """Test retrieving articles by status"""
         # Create articles with different statuses
-        article1 = Article(**sample_article_data)
-        article1.status = ArticleStatus.PENDING
-
-        article2_data = sample_article_data.copy()
-        article2_data["title"] = "Scraped article"
-        article2_data["link"] = "https://example.com/article2"
-        article2 = Article(**article2_data)
-        article2.status = ArticleStatus.SCRAPED
+        article1 = article_factory(status=ArticleStatus.PENDING)
+        article2 = article_factory(
+            title="Scraped article",
+            link="https://example.com/article2",
+            status=ArticleStatus.SCRAPED,
+        )
 
-        # Save articles
-        test_repository.articles.save(article1)
-        test_repository.articles.save(article2)
+        # Save articles in one batch
+        assert test_repository.articles.save_bulk([article1, article2]) == 2
 
         # Get pending articles
         pending_articles = test_repository.articles.get_by_status(ArticleStatus.PENDING)
@@ -176,17 +150,15 @@ class TestFeedRepository:
         assert retrieved_feed is not None
         assert retrieved_feed.id == saved_feed.id
 
-    def test_get_active_feeds(self, test_repository, sample_feed_data):
+    def test_get_active_feeds(self, test_repository, sample_feed_data, feed_factory):
         """Test retrieving active feeds"""
         # Create feeds with different statuses
-        active_feed = Feed(**sample_feed_data)
-        active_feed.status = FeedStatus.ACTIVE
-
-        inactive_feed_data = sample_feed_data.copy()
-        inactive_feed_data["url"] = "https://example.com/inactive.xml"
-        inactive_feed_data["title"] = "Inactive Feed"
-        inactive_feed = Feed(**inactive_feed_data)
-        inactive_feed.status = FeedStatus.INACTIVE
+        active_feed = feed_factory(status=FeedStatus.ACTIVE)
+        inactive_feed = feed_factory(
+            url="https://example.com/inactive.xml",
+            title="Inactive Feed",
+            status=FeedStatus.INACTIVE,
+        )
 
         # Save feeds
         test_repository.feeds.save(active_feed)